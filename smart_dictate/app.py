@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import ctypes
+import dataclasses
 import logging
+import mmap
 import os
 import hashlib
+import re
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -34,27 +39,31 @@ from AppKit import (
     NSEventTypeKeyDown,
     NSMenu,
     NSMenuItem,
-    NSMakeRect,
     NSPopUpButton,
     NSScrollView,
     NSStatusBar,
     NSVariableStatusItemLength,
     NSWindow,
+    NSWorkspace,
+    NSWorkspaceDidActivateApplicationNotification,
+    NSWorkspaceDidWakeNotification,
     NSWindowStyleMaskClosable,
     NSWindowStyleMaskTitled,
     NSSecureTextField,
     NSTextField,
     NSTextView,
+    NSView,
     NSSwitchButton,
     NSForegroundColorAttributeName,
 )
-from Foundation import NSObject, NSOperationQueue
+from Foundation import NSObject, NSOperationQueue, NSString
 
 from smart_dictate.audio_capture import AudioCapture
 from smart_dictate.config import AppConfig, load_config, save_config
 from smart_dictate.hotkeys import Hotkey, HotkeyManager, format_hotkey
 from smart_dictate.languages import list_languages
 from smart_dictate.keychain import get_postprocess_api_key, set_postprocess_api_key
+from smart_dictate.logging_setup import flush_logging, shutdown_logging
 from smart_dictate.login_item import ensure_login_item_start
 from smart_dictate.model_manager import ensure_model
 from smart_dictate.models_catalog import (
@@ -65,7 +74,12 @@ from smart_dictate.models_catalog import (
 )
 from smart_dictate.paths import config_path, models_dir, records_dir
 from smart_dictate.paste import paste_text
-from smart_dictate.postprocess import PostprocessConfig, postprocess_text
+from smart_dictate.postprocess import (
+    PostprocessConfig,
+    close_connections,
+    postprocess_text,
+)
+from smart_dictate.scheduler import DeadlineScheduler, ScheduledCall
 from smart_dictate.settings import Settings
 from smart_dictate.transcription import (
     transcribe_audio,
@@ -74,6 +88,9 @@ from smart_dictate.transcription import (
     write_transcript_json,
 )
 
+_LOGGER = logging.getLogger(__name__)
+_DEFAULT_POSTPROCESS = PostprocessConfig()
+
 NS_MODIFIER_MASK = (
     NSEventModifierFlagControl
     | NSEventModifierFlagOption
@@ -91,29 +108,94 @@ PRESET_MODELS = [
     ("Large-v3-Turbo (1.61 GB)", "mlx-community/whisper-large-v3-turbo"),
 ]
 CUSTOM_MODEL_LABEL = "Custom (HF repo id)"
+PROMPT_PREVIEW_SCAN_CHARS = 200
+
+_LANGUAGE_ITEMS = tuple((code, f"{name} ({code})") for code, name in list_languages())
+_PRESET_NSSTRINGS = tuple(
+    (NSString.stringWithString_(title), model_id) for title, model_id in PRESET_MODELS
+)
+_PRESET_INDEX = {model_id: idx for idx, (_, model_id) in enumerate(PRESET_MODELS)}
+_COLOR_RECORDING = NSColor.systemRedColor()
+_COLOR_LOADING = NSColor.systemGrayColor()
+_COLOR_TRANSCRIBING = NSColor.systemOrangeColor()
+_COLOR_IDLE = NSColor.labelColor()
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+_NS_TO_CG_MODIFIERS = (
+    (NSEventModifierFlagControl, Quartz.kCGEventFlagMaskControl),
+    (NSEventModifierFlagOption, Quartz.kCGEventFlagMaskAlternate),
+    (NSEventModifierFlagShift, Quartz.kCGEventFlagMaskShift),
+    (NSEventModifierFlagCommand, Quartz.kCGEventFlagMaskCommand),
+    (NSEventModifierFlagFunction, Quartz.kCGEventFlagMaskSecondaryFn),
+)
+
+
+def _build_ns_to_cg_table() -> dict[int, int]:
+    table = {0: 0}
+    for ns_flag, cg_flag in _NS_TO_CG_MODIFIERS:
+        for ns_flags, cg_flags in list(table.items()):
+            table[ns_flags | ns_flag] = cg_flags | cg_flag
+    return table
+
+
+_NS_TO_CG_FLAGS = _build_ns_to_cg_table()
 
 
 def _ns_flags_to_cg(flags: int) -> int:
-    result = 0
-    if flags & NSEventModifierFlagControl:
-        result |= Quartz.kCGEventFlagMaskControl
-    if flags & NSEventModifierFlagOption:
-        result |= Quartz.kCGEventFlagMaskAlternate
-    if flags & NSEventModifierFlagShift:
-        result |= Quartz.kCGEventFlagMaskShift
-    if flags & NSEventModifierFlagCommand:
-        result |= Quartz.kCGEventFlagMaskCommand
-    if flags & NSEventModifierFlagFunction:
-        result |= Quartz.kCGEventFlagMaskSecondaryFn
-    return result
+    return _NS_TO_CG_FLAGS[flags & NS_MODIFIER_MASK]
+
+
+_LIBSYSTEM = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+_SYSCTLBYNAME = _LIBSYSTEM.sysctlbyname
+_SYSCTLBYNAME.argtypes = (
+    ctypes.c_char_p,
+    ctypes.c_void_p,
+    ctypes.POINTER(ctypes.c_size_t),
+    ctypes.c_void_p,
+    ctypes.c_size_t,
+)
+_SYSCTLBYNAME.restype = ctypes.c_int
+
+
+def _sysctl_uint64(name: str) -> int:
+    value = ctypes.c_uint64(0)
+    size = ctypes.c_size_t(ctypes.sizeof(value))
+    result = _SYSCTLBYNAME(
+        name.encode("ascii"),
+        ctypes.byref(value),
+        ctypes.byref(size),
+        None,
+        0,
+    )
+    if result != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+    return value.value
+
+
+def _nonempty_field_text(field) -> str | None:
+    value = field.stringValue()
+    if not value:
+        return None
+    return value.strip() or None
 
 
 class StatusBarController(NSObject):
+    _INDICATOR_STATES = {
+        "recording": ("•REC", _COLOR_RECORDING, "Stop Recording", True),
+        "loading": ("SD", _COLOR_LOADING, "Loading Model...", False),
+        "transcribing": ("SD...", _COLOR_TRANSCRIBING, "Start Recording", True),
+        "idle": ("SD", _COLOR_IDLE, "Start Recording", True),
+    }
+
     def initWithApp_(self, app: "DictateApp") -> "StatusBarController | None":
         self = objc.super(StatusBarController, self).init()
         if self is None:
             return None
         self._app = app
+        self._title_cache: dict[tuple[str, int], NSAttributedString] = {}
+        self._last_state: tuple[bool, bool, bool] | None = None
         self._status_item = (
             NSStatusBar.systemStatusBar().statusItemWithLength_(NSVariableStatusItemLength)
         )
@@ -151,39 +233,42 @@ class StatusBarController(NSObject):
         self._app.show_configuration()
 
     def quit_(self, _sender) -> None:
+        self._app.shutdown()
         NSApplication.sharedApplication().terminate_(None)
 
     def update_indicator(self) -> None:
-        if self._app.recording:
-            title = "•REC"
-            color = NSColor.systemRedColor()
-        elif self._app.model_loading:
-            title = "SD"
-            color = NSColor.systemGrayColor()
-        elif self._app.transcribing:
-            title = "SD..."
-            color = NSColor.systemOrangeColor()
+        app_state = (self._app.recording, self._app.model_loading, self._app.transcribing)
+        if app_state == self._last_state:
+            return
+        self._last_state = app_state
+        recording, loading, transcribing = app_state
+        if recording:
+            state = "recording"
+        elif loading:
+            state = "loading"
+        elif transcribing:
+            state = "transcribing"
         else:
-            title = "SD"
-            color = NSColor.labelColor()
+            state = "idle"
+        title, color, toggle_title, toggle_enabled = self._INDICATOR_STATES[state]
         self._set_status_title(title, color)
-        if self._app.recording:
-            self._toggle_item.setTitle_("Stop Recording")
-            self._toggle_item.setEnabled_(True)
-        elif self._app.model_loading:
-            self._toggle_item.setTitle_("Loading Model...")
-            self._toggle_item.setEnabled_(False)
-        else:
-            self._toggle_item.setTitle_("Start Recording")
-            self._toggle_item.setEnabled_(True)
+        self._toggle_item.setTitle_(toggle_title)
+        self._toggle_item.setEnabled_(toggle_enabled)
 
     def _set_status_title(self, title: str, color: NSColor) -> None:
         button = self._status_item.button()
         if button is None:
             self._status_item.setTitle_(title)
             return
-        attributes = {NSForegroundColorAttributeName: color}
-        attributed = NSAttributedString.alloc().initWithString_attributes_(title, attributes)
+        key = (title, objc.pyobjc_id(color))
+        attributed = self._title_cache.get(key)
+        if attributed is None:
+            attributes = {NSForegroundColorAttributeName: color}
+            attributed = NSAttributedString.alloc().initWithString_attributes_(
+                title,
+                attributes,
+            )
+            self._title_cache[key] = attributed
         button.setAttributedTitle_(attributed)
 
 
@@ -212,31 +297,24 @@ class ConfigWindowController(NSObject):
         self._hotkey_monitor = None
         self._capturing_hotkey = False
         self._capture_last_flags = 0
-        self._window = self._build_window()
+        self._downloaded_items: tuple[str, ...] | None = None
+        self._prompt_cache: tuple[str, str] | None = None
+        self._lang_code_to_index: dict[str | None, int] = {}
+        self._window: NSWindow | None = None
         return self
 
     def show(self) -> None:
+        if self._window is None:
+            self._window = self._build_window()
         self.refresh()
         self._window.makeKeyAndOrderFront_(None)
         NSApplication.sharedApplication().activateIgnoringOtherApps_(True)
 
     def refresh(self) -> None:
-        if self._popup is None:
+        if self._window is None or self._popup is None:
             return
         current = self._app.language_override
-        index = 0
-        for idx in range(self._popup.numberOfItems()):
-            item = self._popup.itemAtIndex_(idx)
-            if item is None:
-                continue
-            code = item.representedObject()
-            if code is None and current is None:
-                index = idx
-                break
-            if code is not None and current == str(code):
-                index = idx
-                break
-        self._popup.selectItemAtIndex_(index)
+        self._popup.selectItemAtIndex_(self._lang_code_to_index.get(current, 0))
         self._refresh_models()
         self._refresh_hotkey()
         self._refresh_model_idle()
@@ -278,17 +356,14 @@ class ConfigWindowController(NSObject):
         self._refresh_postprocess()
 
     def postprocessBaseUrlChanged_(self, _sender) -> None:
-        if self._postprocess_base_url_field is None:
-            return
-        value = self._postprocess_base_url_field.stringValue().strip()
-        self._app.set_postprocess_base_url(value or None)
-        self._refresh_postprocess()
+        self._apply_postprocess_base_url()
 
     def postprocessModelChanged_(self, _sender) -> None:
         if self._postprocess_model_field is None:
             return
-        value = self._postprocess_model_field.stringValue().strip()
-        self._app.set_postprocess_model(value or None)
+        self._app.set_postprocess_model(
+            _nonempty_field_text(self._postprocess_model_field)
+        )
         self._refresh_postprocess()
 
     def postprocessSetKey_(self, _sender) -> None:
@@ -296,18 +371,25 @@ class ConfigWindowController(NSObject):
         alert.setAlertStyle_(NSAlertStyleInformational)
         alert.setMessageText_("Set API key")
         alert.setInformativeText_("Paste the API key to store it in Keychain.")
-        field = NSSecureTextField.alloc().initWithFrame_(NSMakeRect(0, 0, 300, 24))
+        field = NSSecureTextField.alloc().initWithFrame_(((0, 0), (300, 24)))
         alert.setAccessoryView_(field)
         alert.addButtonWithTitle_("Save")
         alert.addButtonWithTitle_("Cancel")
         response = alert.runModal()
         if response != NSAlertFirstButtonReturn:
             return
-        value = field.stringValue().strip()
-        if not value:
+        value = _nonempty_field_text(field)
+        if value is None:
             return
-        self._app.set_postprocess_api_key(value)
-        self._refresh_postprocess()
+
+        def store_key():
+            try:
+                self._app.set_postprocess_api_key(value)
+            except RuntimeError as exc:
+                _LOGGER.warning("%s", exc)
+            NSOperationQueue.mainQueue().addOperationWithBlock_(self._refresh_postprocess)
+
+        self._app.io_queue.addOperationWithBlock_(store_key)
 
     def postprocessEditPrompt_(self, _sender) -> None:
         alert = NSAlert.alloc().init()
@@ -316,11 +398,11 @@ class ConfigWindowController(NSObject):
         alert.setInformativeText_(
             "Set a custom system prompt used for post-processing."
         )
-        scroll = NSScrollView.alloc().initWithFrame_(NSMakeRect(0, 0, 460, 220))
+        scroll = NSScrollView.alloc().initWithFrame_(((0, 0), (460, 220)))
         scroll.setHasVerticalScroller_(True)
         scroll.setHasHorizontalScroller_(False)
         scroll.setAutohidesScrollers_(True)
-        text_view = NSTextView.alloc().initWithFrame_(NSMakeRect(0, 0, 440, 220))
+        text_view = NSTextView.alloc().initWithFrame_(((0, 0), (440, 220)))
         text_view.setString_(self._app.postprocess_system_prompt or "")
         scroll.setDocumentView_(text_view)
         alert.setAccessoryView_(scroll)
@@ -361,8 +443,8 @@ class ConfigWindowController(NSObject):
     def modelIdleChanged_(self, _sender) -> None:
         if self._idle_minutes_field is None:
             return
-        value = self._idle_minutes_field.stringValue().strip()
-        if not value:
+        value = _nonempty_field_text(self._idle_minutes_field)
+        if value is None:
             self._app.set_model_idle_minutes(None)
             self._refresh_model_idle()
             return
@@ -377,7 +459,7 @@ class ConfigWindowController(NSObject):
         self._refresh_model_idle()
 
     def _build_window(self) -> NSWindow:
-        frame = NSMakeRect(0, 0, 440, 600)
+        frame = ((0, 0), (440, 600))
         style = NSWindowStyleMaskTitled | NSWindowStyleMaskClosable
         window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
             frame,
@@ -390,61 +472,57 @@ class ConfigWindowController(NSObject):
         window.center()
         window.setDelegate_(self)
         content = window.contentView()
-        label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 520, 160, 22))
+        subviews: list[NSView] = []
+        label = NSTextField.alloc().initWithFrame_(((20, 520), (160, 22)))
         label.setStringValue_("Preferred language")
         label.setBezeled_(False)
         label.setDrawsBackground_(False)
         label.setEditable_(False)
         label.setSelectable_(False)
-        if content is not None:
-            content.addSubview_(label)
+        subviews.append(label)
         self._popup = NSPopUpButton.alloc().initWithFrame_pullsDown_(
-            NSMakeRect(190, 516, 220, 26),
+            ((190, 516), (220, 26)),
             False,
         )
         self._popup.setTarget_(self)
         self._popup.setAction_("languageChanged:")
-        if content is not None:
-            content.addSubview_(self._popup)
+        subviews.append(self._popup)
         self._populate_languages()
-        model_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 480, 160, 22))
+        model_label = NSTextField.alloc().initWithFrame_(((20, 480), (160, 22)))
         model_label.setStringValue_("Model")
         model_label.setBezeled_(False)
         model_label.setDrawsBackground_(False)
         model_label.setEditable_(False)
         model_label.setSelectable_(False)
-        if content is not None:
-            content.addSubview_(model_label)
+        subviews.append(model_label)
         self._model_popup = NSPopUpButton.alloc().initWithFrame_pullsDown_(
-            NSMakeRect(190, 476, 220, 26),
+            ((190, 476), (220, 26)),
             False,
         )
         self._model_popup.setTarget_(self)
         self._model_popup.setAction_("modelChanged:")
-        if content is not None:
-            content.addSubview_(self._model_popup)
+        subviews.append(self._model_popup)
+        self._populate_model_presets()
         self._model_custom_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, 446, 160, 22)
+            ((20, 446), (160, 22))
         )
         self._model_custom_label.setStringValue_(CUSTOM_MODEL_LABEL)
         self._model_custom_label.setBezeled_(False)
         self._model_custom_label.setDrawsBackground_(False)
         self._model_custom_label.setEditable_(False)
         self._model_custom_label.setSelectable_(False)
-        if content is not None:
-            content.addSubview_(self._model_custom_label)
+        subviews.append(self._model_custom_label)
         self._model_custom_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(190, 442, 220, 26)
+            ((190, 442), (220, 26))
         )
         self._model_custom_field.setPlaceholderString_(
             "mlx-community/whisper-..."
         )
         self._model_custom_field.setTarget_(self)
         self._model_custom_field.setAction_("customModelChanged:")
-        if content is not None:
-            content.addSubview_(self._model_custom_field)
+        subviews.append(self._model_custom_field)
         self._model_custom_hint = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(190, 422, 220, 18)
+            ((190, 422), (220, 18))
         )
         self._model_custom_hint.setStringValue_(
             "Use MLX-compatible Whisper model id"
@@ -454,146 +532,130 @@ class ConfigWindowController(NSObject):
         self._model_custom_hint.setEditable_(False)
         self._model_custom_hint.setSelectable_(False)
         self._model_custom_hint.setTextColor_(NSColor.secondaryLabelColor())
-        if content is not None:
-            content.addSubview_(self._model_custom_hint)
-        downloaded_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 396, 160, 22))
+        subviews.append(self._model_custom_hint)
+        downloaded_label = NSTextField.alloc().initWithFrame_(((20, 396), (160, 22)))
         downloaded_label.setStringValue_("Downloaded models")
         downloaded_label.setBezeled_(False)
         downloaded_label.setDrawsBackground_(False)
         downloaded_label.setEditable_(False)
         downloaded_label.setSelectable_(False)
-        if content is not None:
-            content.addSubview_(downloaded_label)
+        subviews.append(downloaded_label)
         self._downloaded_popup = NSPopUpButton.alloc().initWithFrame_pullsDown_(
-            NSMakeRect(190, 392, 220, 26),
+            ((190, 392), (220, 26)),
             False,
         )
-        if content is not None:
-            content.addSubview_(self._downloaded_popup)
-        self._delete_button = NSButton.alloc().initWithFrame_(NSMakeRect(190, 356, 100, 26))
+        subviews.append(self._downloaded_popup)
+        self._delete_button = NSButton.alloc().initWithFrame_(((190, 356), (100, 26)))
         self._delete_button.setTitle_("Delete")
         self._delete_button.setTarget_(self)
         self._delete_button.setAction_("deleteModel:")
-        if content is not None:
-            content.addSubview_(self._delete_button)
+        subviews.append(self._delete_button)
         self._postprocess_enabled_button = NSButton.alloc().initWithFrame_(
-            NSMakeRect(20, 316, 220, 22)
+            ((20, 316), (220, 22))
         )
         self._postprocess_enabled_button.setButtonType_(NSSwitchButton)
         self._postprocess_enabled_button.setTitle_("Enable post-processing")
         self._postprocess_enabled_button.setTarget_(self)
         self._postprocess_enabled_button.setAction_("postprocessEnabledChanged:")
-        if content is not None:
-            content.addSubview_(self._postprocess_enabled_button)
+        subviews.append(self._postprocess_enabled_button)
         postprocess_url_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, 286, 160, 22)
+            ((20, 286), (160, 22))
         )
         postprocess_url_label.setStringValue_("Postprocess base URL")
         postprocess_url_label.setBezeled_(False)
         postprocess_url_label.setDrawsBackground_(False)
         postprocess_url_label.setEditable_(False)
         postprocess_url_label.setSelectable_(False)
-        if content is not None:
-            content.addSubview_(postprocess_url_label)
+        subviews.append(postprocess_url_label)
         self._postprocess_base_url_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(190, 282, 220, 26)
+            ((190, 282), (220, 26))
         )
         self._postprocess_base_url_field.setPlaceholderString_("https://api.openai.com")
         self._postprocess_base_url_field.setTarget_(self)
         self._postprocess_base_url_field.setAction_("postprocessBaseUrlChanged:")
-        if content is not None:
-            content.addSubview_(self._postprocess_base_url_field)
+        subviews.append(self._postprocess_base_url_field)
         postprocess_model_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, 256, 160, 22)
+            ((20, 256), (160, 22))
         )
         postprocess_model_label.setStringValue_("Postprocess model")
         postprocess_model_label.setBezeled_(False)
         postprocess_model_label.setDrawsBackground_(False)
         postprocess_model_label.setEditable_(False)
         postprocess_model_label.setSelectable_(False)
-        if content is not None:
-            content.addSubview_(postprocess_model_label)
+        subviews.append(postprocess_model_label)
         self._postprocess_model_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(190, 252, 220, 26)
+            ((190, 252), (220, 26))
         )
         self._postprocess_model_field.setPlaceholderString_("gpt-4o-mini")
         self._postprocess_model_field.setTarget_(self)
         self._postprocess_model_field.setAction_("postprocessModelChanged:")
-        if content is not None:
-            content.addSubview_(self._postprocess_model_field)
+        subviews.append(self._postprocess_model_field)
         self._postprocess_key_status_button = NSButton.alloc().initWithFrame_(
-            NSMakeRect(20, 226, 220, 22)
+            ((20, 226), (220, 22))
         )
         self._postprocess_key_status_button.setButtonType_(NSSwitchButton)
         self._postprocess_key_status_button.setTitle_("API key stored in Keychain")
         self._postprocess_key_status_button.setEnabled_(False)
-        if content is not None:
-            content.addSubview_(self._postprocess_key_status_button)
+        subviews.append(self._postprocess_key_status_button)
         self._postprocess_set_key_button = NSButton.alloc().initWithFrame_(
-            NSMakeRect(190, 194, 220, 26)
+            ((190, 194), (220, 26))
         )
         self._postprocess_set_key_button.setTitle_("Set API key")
         self._postprocess_set_key_button.setTarget_(self)
         self._postprocess_set_key_button.setAction_("postprocessSetKey:")
-        if content is not None:
-            content.addSubview_(self._postprocess_set_key_button)
+        subviews.append(self._postprocess_set_key_button)
         postprocess_prompt_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, 166, 160, 22)
+            ((20, 166), (160, 22))
         )
         postprocess_prompt_label.setStringValue_("Postprocess prompt")
         postprocess_prompt_label.setBezeled_(False)
         postprocess_prompt_label.setDrawsBackground_(False)
         postprocess_prompt_label.setEditable_(False)
         postprocess_prompt_label.setSelectable_(False)
-        if content is not None:
-            content.addSubview_(postprocess_prompt_label)
+        subviews.append(postprocess_prompt_label)
         self._postprocess_edit_prompt_button = NSButton.alloc().initWithFrame_(
-            NSMakeRect(190, 162, 220, 26)
+            ((190, 162), (220, 26))
         )
         self._postprocess_edit_prompt_button.setTitle_("Edit prompt")
         self._postprocess_edit_prompt_button.setTarget_(self)
         self._postprocess_edit_prompt_button.setAction_("postprocessEditPrompt:")
-        if content is not None:
-            content.addSubview_(self._postprocess_edit_prompt_button)
+        subviews.append(self._postprocess_edit_prompt_button)
         self._postprocess_prompt_status_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(190, 140, 220, 18)
+            ((190, 140), (220, 18))
         )
         self._postprocess_prompt_status_label.setBezeled_(False)
         self._postprocess_prompt_status_label.setDrawsBackground_(False)
         self._postprocess_prompt_status_label.setEditable_(False)
         self._postprocess_prompt_status_label.setSelectable_(False)
         self._postprocess_prompt_status_label.setTextColor_(NSColor.secondaryLabelColor())
-        if content is not None:
-            content.addSubview_(self._postprocess_prompt_status_label)
-        idle_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 50, 160, 22))
+        subviews.append(self._postprocess_prompt_status_label)
+        idle_label = NSTextField.alloc().initWithFrame_(((20, 50), (160, 22)))
         idle_label.setStringValue_("Unload model after (min)")
         idle_label.setBezeled_(False)
         idle_label.setDrawsBackground_(False)
         idle_label.setEditable_(False)
         idle_label.setSelectable_(False)
-        if content is not None:
-            content.addSubview_(idle_label)
+        subviews.append(idle_label)
         self._idle_minutes_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(190, 46, 220, 26)
+            ((190, 46), (220, 26))
         )
         self._idle_minutes_field.setTarget_(self)
         self._idle_minutes_field.setAction_("modelIdleChanged:")
-        if content is not None:
-            content.addSubview_(self._idle_minutes_field)
-        hotkey_label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 10, 160, 22))
+        subviews.append(self._idle_minutes_field)
+        hotkey_label = NSTextField.alloc().initWithFrame_(((20, 10), (160, 22)))
         hotkey_label.setStringValue_("Hotkey")
         hotkey_label.setBezeled_(False)
         hotkey_label.setDrawsBackground_(False)
         hotkey_label.setEditable_(False)
         hotkey_label.setSelectable_(False)
-        if content is not None:
-            content.addSubview_(hotkey_label)
-        self._hotkey_button = NSButton.alloc().initWithFrame_(NSMakeRect(190, 6, 220, 26))
+        subviews.append(hotkey_label)
+        self._hotkey_button = NSButton.alloc().initWithFrame_(((190, 6), (220, 26)))
         self._hotkey_button.setTitle_("Set hotkey")
         self._hotkey_button.setTarget_(self)
         self._hotkey_button.setAction_("hotkeyClicked:")
+        subviews.append(self._hotkey_button)
         if content is not None:
-            content.addSubview_(self._hotkey_button)
+            content.setSubviews_(subviews)
         self._refresh_models()
         return window
 
@@ -605,18 +667,19 @@ class ConfigWindowController(NSObject):
         auto_item = self._popup.itemAtIndex_(0)
         if auto_item is not None:
             auto_item.setRepresentedObject_(None)
-        for code, name in list_languages():
-            title = f"{name} ({code})"
+        self._lang_code_to_index = {None: 0}
+        for index, (code, title) in enumerate(_LANGUAGE_ITEMS, start=1):
             self._popup.addItemWithTitle_(title)
             item = self._popup.lastItem()
             if item is not None:
                 item.setRepresentedObject_(code)
+            self._lang_code_to_index[code] = index
 
-    def _refresh_models(self) -> None:
-        if self._model_popup is None or self._downloaded_popup is None:
+    def _populate_model_presets(self) -> None:
+        if self._model_popup is None:
             return
         self._model_popup.removeAllItems()
-        for title, model_id in PRESET_MODELS:
+        for title, model_id in _PRESET_NSSTRINGS:
             self._model_popup.addItemWithTitle_(title)
             item = self._model_popup.lastItem()
             if item is not None:
@@ -625,34 +688,50 @@ class ConfigWindowController(NSObject):
         custom_item = self._model_popup.lastItem()
         if custom_item is not None:
             custom_item.setRepresentedObject_(None)
+
+    def _refresh_models(self) -> None:
+        if self._model_popup is None or self._downloaded_popup is None:
+            return
         current = self._app.current_model_id
-        custom_selected = True
-        for idx, (_, model_id) in enumerate(PRESET_MODELS):
-            if model_id == current:
-                self._model_popup.selectItemAtIndex_(idx)
-                custom_selected = False
-                break
-        if custom_selected:
-            self._model_popup.selectItemAtIndex_(len(PRESET_MODELS))
+        downloaded = tuple(self._app.downloaded_models)
+        if downloaded != self._downloaded_items:
+            self._sync_downloaded_popup(downloaded)
+        preset_index = _PRESET_INDEX.get(current)
+        custom_selected = preset_index is None
+        self._model_popup.selectItemAtIndex_(
+            len(PRESET_MODELS) if custom_selected else preset_index
+        )
         self._set_custom_model_visible(custom_selected)
         if custom_selected and self._model_custom_field is not None:
             self._model_custom_field.setStringValue_(current or "")
-        self._downloaded_popup.removeAllItems()
-        downloaded = self._app.downloaded_models
+
+    def _sync_downloaded_popup(self, downloaded: tuple[str, ...]) -> None:
+        popup = self._downloaded_popup
+        shown = self._downloaded_items or ()
         if not downloaded:
-            self._downloaded_popup.addItemWithTitle_("None")
-            none_item = self._downloaded_popup.itemAtIndex_(0)
+            popup.removeAllItems()
+            popup.addItemWithTitle_("None")
+            none_item = popup.itemAtIndex_(0)
             if none_item is not None:
                 none_item.setRepresentedObject_(None)
         else:
-            for model_id in downloaded:
-                self._downloaded_popup.addItemWithTitle_(model_id)
-                item = self._downloaded_popup.lastItem()
+            if not shown:
+                popup.removeAllItems()
+            keep = set(downloaded)
+            for idx in range(len(shown) - 1, -1, -1):
+                if shown[idx] not in keep:
+                    popup.removeItemAtIndex_(idx)
+            present = set(shown)
+            for idx, model_id in enumerate(downloaded):
+                if model_id in present:
+                    continue
+                popup.insertItemWithTitle_atIndex_(model_id, idx)
+                item = popup.itemAtIndex_(idx)
                 if item is not None:
                     item.setRepresentedObject_(model_id)
-        has_downloaded = bool(downloaded)
+        self._downloaded_items = downloaded
         if self._delete_button is not None:
-            self._delete_button.setEnabled_(has_downloaded)
+            self._delete_button.setEnabled_(bool(downloaded))
 
     def _set_custom_model_visible(self, visible: bool) -> None:
         if self._model_custom_label is not None:
@@ -665,12 +744,20 @@ class ConfigWindowController(NSObject):
     def _apply_custom_model(self) -> None:
         if self._model_custom_field is None:
             return
-        value = self._model_custom_field.stringValue().strip()
-        if not value:
+        value = _nonempty_field_text(self._model_custom_field)
+        if value is None:
             return
         self._app.set_model_override(value)
         self._refresh_models()
 
+    def _apply_postprocess_base_url(self) -> None:
+        if self._postprocess_base_url_field is None:
+            return
+        self._app.set_postprocess_base_url(
+            _nonempty_field_text(self._postprocess_base_url_field)
+        )
+        self._refresh_postprocess()
+
     def _refresh_hotkey(self) -> None:
         if self._hotkey_button is None or self._capturing_hotkey:
             return
@@ -714,9 +801,7 @@ class ConfigWindowController(NSObject):
             self._postprocess_edit_prompt_button.setTitle_(title)
         if self._postprocess_prompt_status_label is not None:
             if prompt:
-                preview = " ".join(prompt.split())
-                if len(preview) > 44:
-                    preview = f"{preview[:41]}..."
+                preview = self._prompt_preview(prompt)
                 self._postprocess_prompt_status_label.setStringValue_(preview)
                 self._postprocess_prompt_status_label.setToolTip_(prompt)
             else:
@@ -724,6 +809,18 @@ class ConfigWindowController(NSObject):
                 self._postprocess_prompt_status_label.setToolTip_(None)
         self._set_postprocess_fields_enabled(enabled)
 
+    def _prompt_preview(self, prompt: str) -> str:
+        if self._prompt_cache is not None and self._prompt_cache[0] == prompt:
+            return self._prompt_cache[1]
+        head = prompt[:PROMPT_PREVIEW_SCAN_CHARS]
+        preview = _WHITESPACE_RE.sub(" ", head).strip()
+        if len(preview) <= 44 and len(head) < len(prompt):
+            preview = _WHITESPACE_RE.sub(" ", prompt).strip()
+        if len(preview) > 44:
+            preview = f"{preview[:41]}..."
+        self._prompt_cache = (prompt, preview)
+        return preview
+
     def _set_postprocess_fields_enabled(self, enabled: bool) -> None:
         fields = [
             self._postprocess_base_url_field,
@@ -773,6 +870,7 @@ class ConfigWindowController(NSObject):
 
     def windowWillClose_(self, _notification) -> None:
         self._stop_hotkey_capture()
+        self._app.flush_config()
 
 
 class DictateApp:
@@ -782,17 +880,46 @@ class DictateApp:
         self._config_window: ConfigWindowController | None = None
         self._model_loading = False
         self._warmup_id = 0
-        self._pending_stop_timer: threading.Timer | None = None
+        self._pending_stop_call: ScheduledCall | None = None
         self._pending_stop_path: Path | None = None
         self._pending_stop_lock = threading.Lock()
         self._stop_cancel_window_seconds = 0.4
         self._transcribing_count = 0
         self._transcribing_lock = threading.Lock()
+        self._ui_refresh_pending = False
+        self._status_refresh_pending = False
+        self._refresh_lock = threading.Lock()
+        self._io_queue = NSOperationQueue.alloc().init()
+        self._io_queue.setMaxConcurrentOperationCount_(1)
+        self._executor = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix="sd-worker",
+        )
+        self._background_executor = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix="sd-background",
+        )
+        self._postprocess_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="sd-postprocess",
+        )
+        self._stop_event = threading.Event()
+        self._scheduler = DeadlineScheduler()
+        self._log_flush_interval_seconds = 5.0
+        self._scheduler.call_later(
+            self._log_flush_interval_seconds,
+            self._flush_logs_periodically,
+        )
+        self._config_dirty = False
+        self._config_flush_call: ScheduledCall | None = None
+        self._config_flush_lock = threading.Lock()
+        self._config_flush_delay_seconds = 0.3
         self._pending_permission_notice = False
         self._accessibility_watch_active = False
-        self._model_idle_minutes: int | None = None
+        self._accessibility_recheck = threading.Event()
+        self._accessibility_poll_max_seconds = 30.0
         self._model_idle_seconds = 0
-        self._model_idle_timer: threading.Timer | None = None
+        self._model_idle_call: ScheduledCall | None = None
         self._model_idle_lock = threading.Lock()
         self._last_model_use = 0.0
         self._last_model_id: str | None = None
@@ -808,16 +935,13 @@ class DictateApp:
             channels=self._settings.channels,
         )
         self._config_path = config_path()
+        self._models_dir = models_dir()
         self._config = load_config(self._config_path)
+        self._app_stat: tuple[str, int, int] | None = None
         self._app_hash = self._compute_app_hash()
-        self._language_override = self._config.language
-        self._model_override = self._config.model_id
-        self._postprocess_enabled = self._config.postprocess_enabled
-        self._postprocess_base_url = self._config.postprocess_base_url
-        self._postprocess_model = self._config.postprocess_model
-        self._postprocess_system_prompt = self._config.postprocess_system_prompt
-        self._model_idle_minutes = self._config.model_idle_minutes
-        self._model_idle_seconds = self._compute_model_idle_seconds(self._model_idle_minutes)
+        self._model_idle_seconds = self._compute_model_idle_seconds(
+            self._config.model_idle_minutes
+        )
         self._hotkey_modifiers = (
             self._config.hotkey_modifiers
             if self._config.hotkey_modifiers is not None
@@ -828,9 +952,10 @@ class DictateApp:
             if self._config.hotkey_keycode is not None
             else self._settings.hotkey_keycode
         )
-        self._hotkey_label = self._config.hotkey_label
         self._model_catalog: list[str] = []
-        self._downloaded_models = list_downloaded_models(models_dir())
+        self._downloaded_models: list[str] = []
+        self._downloaded_models_mtime: int | None = -1
+        self._refresh_downloaded_models()
         self._catalog_loaded = False
         self._hotkeys = HotkeyManager(self.toggle_recording)
         self._hotkeys.register(
@@ -839,7 +964,7 @@ class DictateApp:
         self._reset_permissions_on_start()
         ensure_login_item_start()
         if self._defer_warmup:
-            logging.getLogger(__name__).info(
+            _LOGGER.info(
                 "Deferring model warmup due to low RAM (%s bytes).",
                 self._total_memory_bytes,
             )
@@ -850,12 +975,7 @@ class DictateApp:
     @staticmethod
     def _get_total_memory_bytes() -> int | None:
         try:
-            output = subprocess.check_output(
-                ["sysctl", "-n", "hw.memsize"],
-                text=True,
-                stderr=subprocess.DEVNULL,
-            ).strip()
-            return int(output)
+            return _sysctl_uint64("hw.memsize")
         except Exception:
             try:
                 pages = os.sysconf("SC_PHYS_PAGES")
@@ -865,49 +985,108 @@ class DictateApp:
                 return None
 
     def _compute_app_hash(self) -> str | None:
-        try:
-            if getattr(sys, "frozen", False):
-                path = Path(sys.executable)
-            else:
-                path = Path(__file__).resolve()
-        except Exception:
+        if not getattr(sys, "frozen", False):
             return None
-        if not path.exists():
+        path = Path(sys.executable)
+        try:
+            stat = path.stat()
+        except OSError:
             return None
-        hasher = hashlib.sha256()
+        self._app_stat = (str(path), stat.st_size, stat.st_mtime_ns)
+        if self._config.app_hash and self._app_stat == self._cached_app_stat():
+            return self._config.app_hash
         try:
             with path.open("rb") as handle:
-                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                    hasher.update(chunk)
+                try:
+                    with mmap.mmap(
+                        handle.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mapped:
+                        return hashlib.sha256(mapped).hexdigest()
+                except (OSError, ValueError):
+                    return hashlib.file_digest(handle, "sha256").hexdigest()
         except Exception:
             return None
-        return hasher.hexdigest()
+
+    def _cached_app_stat(self) -> tuple[str | None, int | None, int | None]:
+        return (self._config.app_path, self._config.app_size, self._config.app_mtime_ns)
 
     def _build_postprocess_config(self) -> PostprocessConfig:
-        default_config = PostprocessConfig()
-        return PostprocessConfig(
-            enabled=self._postprocess_enabled,
-            base_url=self._postprocess_base_url or default_config.base_url,
-            model=self._postprocess_model or default_config.model,
-            system_prompt=self._postprocess_system_prompt or default_config.system_prompt,
-            timeout_seconds=default_config.timeout_seconds,
+        config = self._config
+        return dataclasses.replace(
+            _DEFAULT_POSTPROCESS,
+            enabled=config.postprocess_enabled,
+            base_url=config.postprocess_base_url or _DEFAULT_POSTPROCESS.base_url,
+            model=config.postprocess_model or _DEFAULT_POSTPROCESS.model,
+            system_prompt=(
+                config.postprocess_system_prompt or _DEFAULT_POSTPROCESS.system_prompt
+            ),
         )
 
+    def _update_config(self, **changes) -> None:
+        with self._config_flush_lock:
+            self._config = dataclasses.replace(self._config, **changes)
+        self._save_config_state()
+
     def _save_config_state(self) -> None:
-        self._config = AppConfig(
-            language=self._language_override,
-            model_id=self._model_override,
-            model_idle_minutes=self._model_idle_minutes,
-            app_hash=self._app_hash,
-            postprocess_enabled=self._postprocess_enabled,
-            postprocess_base_url=self._postprocess_base_url,
-            postprocess_model=self._postprocess_model,
-            postprocess_system_prompt=self._postprocess_system_prompt,
-            hotkey_modifiers=self._hotkey_modifiers,
-            hotkey_keycode=self._hotkey_keycode,
-            hotkey_label=self._hotkey_label,
+        with self._config_flush_lock:
+            self._config_dirty = True
+            if self._config_flush_call is not None:
+                self._config_flush_call.cancel()
+            self._config_flush_call = self._scheduler.call_later(
+                self._config_flush_delay_seconds,
+                self._flush_config_state,
+            )
+
+    def _flush_config_state(self) -> None:
+        with self._config_flush_lock:
+            if self._config_flush_call is not None:
+                self._config_flush_call.cancel()
+                self._config_flush_call = None
+            if not self._config_dirty:
+                return
+            self._config_dirty = False
+            app_path, app_size, app_mtime_ns = self._app_stat or (None, None, None)
+            config = dataclasses.replace(
+                self._config,
+                app_hash=self._app_hash,
+                app_path=app_path,
+                app_size=app_size,
+                app_mtime_ns=app_mtime_ns,
+            )
+            self._config = config
+            self._io_queue.addOperationWithBlock_(lambda: self._write_config(config))
+
+    def flush_config(self) -> None:
+        self._flush_config_state()
+
+    def shutdown(self) -> None:
+        self._stop_event.set()
+        self._accessibility_recheck.set()
+        self.flush_config()
+        self._io_queue.waitUntilAllOperationsAreFinished()
+        self._scheduler.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._background_executor.shutdown(wait=False, cancel_futures=True)
+        self._postprocess_executor.shutdown(wait=False, cancel_futures=True)
+        close_connections()
+        shutdown_logging()
+
+    def _flush_logs_periodically(self) -> None:
+        flush_logging()
+        self._scheduler.call_later(
+            self._log_flush_interval_seconds,
+            self._flush_logs_periodically,
         )
-        save_config(self._config_path, self._config)
+
+    def _write_config(self, config: AppConfig) -> None:
+        try:
+            save_config(self._config_path, config)
+        except Exception as exc:
+            _LOGGER.error("Failed to save config: %s", exc)
+
+    @property
+    def io_queue(self) -> NSOperationQueue:
+        return self._io_queue
 
     @property
     def recording(self) -> bool:
@@ -915,7 +1094,7 @@ class DictateApp:
 
     @property
     def language_override(self) -> str | None:
-        return self._language_override
+        return self._config.language
 
     @property
     def model_loading(self) -> bool:
@@ -923,8 +1102,7 @@ class DictateApp:
 
     @property
     def transcribing(self) -> bool:
-        with self._transcribing_lock:
-            return self._transcribing_count > 0
+        return self._transcribing_count > 0
 
     def _default_model_idle_minutes(self) -> int:
         if (
@@ -943,15 +1121,15 @@ class DictateApp:
 
     @property
     def model_idle_minutes(self) -> int:
-        if self._model_idle_minutes is None:
+        minutes = self._config.model_idle_minutes
+        if minutes is None:
             return self._default_model_idle_minutes()
-        if self._model_idle_minutes < 0:
+        if minutes < 0:
             return 0
-        return self._model_idle_minutes
+        return minutes
 
     def set_language_override(self, language: str | None) -> None:
-        self._language_override = language
-        self._save_config_state()
+        self._update_config(language=language)
 
     @property
     def model_catalog(self) -> list[str]:
@@ -963,13 +1141,12 @@ class DictateApp:
 
     @property
     def current_model_id(self) -> str:
-        return self._model_override or self._settings.model_id
+        return self._config.model_id or self._settings.model_id
 
     def set_model_override(self, model_id: str) -> None:
-        if model_id == self._model_override:
+        if model_id == self._config.model_id:
             return
-        self._model_override = model_id
-        self._save_config_state()
+        self._update_config(model_id=model_id)
         self._start_model_download(model_id)
 
     @property
@@ -982,19 +1159,19 @@ class DictateApp:
 
     @property
     def hotkey_label(self) -> str | None:
-        return self._hotkey_label
+        return self._config.hotkey_label
 
     @property
     def postprocess_enabled(self) -> bool:
-        return self._postprocess_enabled
+        return self._config.postprocess_enabled
 
     @property
     def postprocess_base_url(self) -> str | None:
-        return self._postprocess_base_url
+        return self._config.postprocess_base_url
 
     @property
     def postprocess_model(self) -> str | None:
-        return self._postprocess_model
+        return self._config.postprocess_model
 
     @property
     def postprocess_api_key_set(self) -> bool:
@@ -1002,40 +1179,42 @@ class DictateApp:
 
     @property
     def postprocess_system_prompt(self) -> str | None:
-        return self._postprocess_system_prompt
+        return self._config.postprocess_system_prompt
 
     def set_hotkey(self, modifiers: int, keycode: int | None, label: str | None) -> None:
+        try:
+            self._hotkeys.register(Hotkey(modifiers=modifiers, keycode=keycode))
+        except RuntimeError as exc:
+            _LOGGER.warning("Failed to apply hotkey: %s", exc)
+            return
         self._hotkey_modifiers = modifiers
         self._hotkey_keycode = keycode
-        self._hotkey_label = label
-        self._hotkeys.register(Hotkey(modifiers=modifiers, keycode=keycode))
-        self._save_config_state()
+        self._update_config(
+            hotkey_modifiers=modifiers,
+            hotkey_keycode=keycode,
+            hotkey_label=label,
+        )
 
     def set_postprocess_enabled(self, enabled: bool) -> None:
-        self._postprocess_enabled = bool(enabled)
-        self._save_config_state()
+        self._update_config(postprocess_enabled=bool(enabled))
 
     def set_postprocess_base_url(self, base_url: str | None) -> None:
-        self._postprocess_base_url = base_url
-        self._save_config_state()
+        self._update_config(postprocess_base_url=base_url)
 
     def set_postprocess_model(self, model: str | None) -> None:
-        self._postprocess_model = model
-        self._save_config_state()
+        self._update_config(postprocess_model=model)
 
     def set_postprocess_api_key(self, api_key: str) -> None:
         set_postprocess_api_key(api_key)
 
     def set_postprocess_system_prompt(self, prompt: str | None) -> None:
-        self._postprocess_system_prompt = prompt
-        self._save_config_state()
+        self._update_config(postprocess_system_prompt=prompt)
 
     def set_model_idle_minutes(self, minutes: int | None) -> None:
         if minutes is not None and minutes < 0:
             minutes = 0
-        self._model_idle_minutes = minutes
         self._model_idle_seconds = self._compute_model_idle_seconds(minutes)
-        self._save_config_state()
+        self._update_config(model_idle_minutes=minutes)
         self._schedule_model_unload()
 
     def reset_permission(self, service: str) -> bool:
@@ -1047,20 +1226,20 @@ class DictateApp:
                 stderr=subprocess.DEVNULL,
             )
             if result.returncode == 0:
-                logging.getLogger(__name__).info(
+                _LOGGER.info(
                     "Reset %s permission for %s",
                     service,
                     BUNDLE_ID,
                 )
             else:
-                logging.getLogger(__name__).warning(
+                _LOGGER.warning(
                     "tccutil reset %s failed with exit code %s",
                     service,
                     result.returncode,
                 )
             return result.returncode == 0
         except Exception as exc:
-            logging.getLogger(__name__).warning(
+            _LOGGER.warning(
                 "Failed to reset %s permission: %s",
                 service,
                 exc,
@@ -1068,11 +1247,11 @@ class DictateApp:
             return False
 
     def _reset_permissions_on_start(self) -> None:
-        if not getattr(sys, "frozen", False):
-            return
         if not self._app_hash:
             return
         if self._config.app_hash == self._app_hash:
+            if self._app_stat != self._cached_app_stat():
+                self._save_config_state()
             return
         self.reset_permission("Microphone")
         self.reset_permission("Accessibility")
@@ -1097,12 +1276,13 @@ class DictateApp:
                 stderr=subprocess.DEVNULL,
             )
         except Exception as exc:
-            logging.getLogger(__name__).warning(
+            _LOGGER.warning(
                 "Failed to open Accessibility settings: %s",
                 exc,
             )
 
-    def _watch_accessibility_and_enable_hotkeys(self) -> None:
+    def _watch_accessibility_and_enable_hotkeys(self, observers: list) -> None:
+        delay = 1.0
         try:
             while True:
                 if self._is_accessibility_trusted():
@@ -1110,16 +1290,46 @@ class DictateApp:
                         self._enable_hotkeys_after_accessibility_granted
                     )
                     return
-                time.sleep(1.0)
+                woken = self._accessibility_recheck.wait(delay)
+                if self._stop_event.is_set():
+                    return
+                if woken:
+                    self._accessibility_recheck.clear()
+                    delay = 1.0
+                else:
+                    delay = min(delay * 2, self._accessibility_poll_max_seconds)
         finally:
             self._accessibility_watch_active = False
+            NSOperationQueue.mainQueue().addOperationWithBlock_(
+                lambda: self._remove_accessibility_observers(observers)
+            )
+
+    def _add_accessibility_observers(self) -> list:
+        center = NSWorkspace.sharedWorkspace().notificationCenter()
+        return [
+            center.addObserverForName_object_queue_usingBlock_(
+                name,
+                None,
+                None,
+                lambda _notification: self._accessibility_recheck.set(),
+            )
+            for name in (
+                NSWorkspaceDidActivateApplicationNotification,
+                NSWorkspaceDidWakeNotification,
+            )
+        ]
+
+    def _remove_accessibility_observers(self, observers: list) -> None:
+        center = NSWorkspace.sharedWorkspace().notificationCenter()
+        for observer in observers:
+            center.removeObserver_(observer)
 
     def _enable_hotkeys_after_accessibility_granted(self) -> None:
         self._clear_pending_permission_notice()
         try:
             self._hotkeys.start()
         except RuntimeError as exc:
-            logging.getLogger(__name__).warning(
+            _LOGGER.warning(
                 "Failed to activate hotkeys after Accessibility grant: %s",
                 exc,
             )
@@ -1133,19 +1343,24 @@ class DictateApp:
         if self._accessibility_watch_active:
             return
         self._accessibility_watch_active = True
-        thread = threading.Thread(
+        self._accessibility_recheck.clear()
+        observers = self._add_accessibility_observers()
+        threading.Thread(
             target=self._watch_accessibility_and_enable_hotkeys,
+            args=(observers,),
+            name="sd-accessibility",
             daemon=True,
-        )
-        thread.start()
+        ).start()
 
     def _clear_pending_permission_notice(self) -> None:
         if not self._pending_permission_notice:
             return
         self._pending_permission_notice = False
 
-    def _show_permission_notice(self) -> None:
-        if self._is_accessibility_trusted():
+    def _show_permission_notice(self, trusted: bool | None = None) -> None:
+        if trusted is None:
+            trusted = self._is_accessibility_trusted()
+        if trusted:
             self._clear_pending_permission_notice()
             return
         alert = NSAlert.alloc().init()
@@ -1165,8 +1380,23 @@ class DictateApp:
         self._start_accessibility_watch()
 
     def delete_downloaded_model(self, model_id: str) -> None:
-        delete_model(models_dir(), model_id)
-        self._downloaded_models = list_downloaded_models(models_dir())
+        delete_model(self._models_dir, model_id)
+        self._refresh_downloaded_models(force=True)
+
+    def _refresh_downloaded_models(self, *, force: bool = False) -> bool:
+        directory = self._models_dir
+        try:
+            mtime_ns: int | None = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        if not force and mtime_ns == self._downloaded_models_mtime:
+            return False
+        downloaded = list_downloaded_models(directory)
+        self._downloaded_models_mtime = mtime_ns
+        if downloaded == self._downloaded_models:
+            return False
+        self._downloaded_models = downloaded
+        return True
 
     def show_configuration(self) -> None:
         if self._config_window is None:
@@ -1181,8 +1411,7 @@ class DictateApp:
     def _start_model_catalog_fetch(self) -> None:
         if self._catalog_loaded:
             return
-        thread = threading.Thread(target=self._load_model_catalog, daemon=True)
-        thread.start()
+        self._background_executor.submit(self._load_model_catalog)
 
     def _load_model_catalog(self) -> None:
         self._model_catalog = fetch_whisper_models()
@@ -1195,20 +1424,14 @@ class DictateApp:
         self._warmup_id += 1
         warmup_id = self._warmup_id
         self._set_model_loading(True)
-        thread = threading.Thread(
-            target=self._warmup_model,
-            args=(model_id, warmup_id),
-            daemon=True,
-        )
-        thread.start()
+        self._executor.submit(self._warmup_model, model_id, warmup_id)
 
     def _warmup_model(self, model_id: str, warmup_id: int) -> None:
-        logger = logging.getLogger(__name__)
         try:
             warmup_model(model_id)
             self._mark_model_used(model_id)
         except Exception as exc:
-            logger.error("Model warmup failed: %s", exc)
+            _LOGGER.error("Model warmup failed: %s", exc)
         finally:
             if warmup_id == self._warmup_id:
                 self._set_model_loading(False)
@@ -1219,32 +1442,29 @@ class DictateApp:
         self._warmup_id += 1
         warmup_id = self._warmup_id
         self._set_model_loading(True)
-        if is_model_downloaded(models_dir(), model_id):
-            self._downloaded_models = list_downloaded_models(models_dir())
-            self._schedule_ui_refresh()
+        if is_model_downloaded(self._models_dir, model_id):
+            if (
+                model_id not in self._downloaded_models
+                and self._refresh_downloaded_models()
+            ):
+                self._schedule_ui_refresh()
             if warmup:
-                thread = threading.Thread(
-                    target=self._warmup_model,
-                    args=(model_id, warmup_id),
-                    daemon=True,
-                )
-                thread.start()
+                self._executor.submit(self._warmup_model, model_id, warmup_id)
             else:
                 self._set_model_loading(False)
             return
-        thread = threading.Thread(
-            target=self._download_model,
-            args=(model_id, warmup_id, warmup),
-            daemon=True,
+        self._background_executor.submit(
+            self._download_model,
+            model_id,
+            warmup_id,
+            warmup,
         )
-        thread.start()
 
     def _download_model(self, model_id: str, warmup_id: int, warmup: bool) -> None:
-        logger = logging.getLogger(__name__)
         try:
-            ensure_model(model_id, models_dir())
+            ensure_model(model_id, self._models_dir)
         except Exception as exc:
-            logger.error("Model download failed: %s", exc)
+            _LOGGER.error("Model download failed: %s", exc)
             if warmup_id == self._warmup_id:
                 self._set_model_loading(False)
             return
@@ -1253,16 +1473,22 @@ class DictateApp:
                 warmup_model(model_id)
                 self._mark_model_used(model_id)
             except Exception as exc:
-                logger.error("Model warmup failed: %s", exc)
-        self._downloaded_models = list_downloaded_models(models_dir())
-        self._schedule_ui_refresh()
+                _LOGGER.error("Model warmup failed: %s", exc)
+        if self._refresh_downloaded_models():
+            self._schedule_ui_refresh()
         if warmup_id == self._warmup_id:
             self._set_model_loading(False)
 
     def _schedule_ui_refresh(self) -> None:
         if self._config_window is None:
             return
+        with self._refresh_lock:
+            if self._ui_refresh_pending:
+                return
+            self._ui_refresh_pending = True
         def refresh():
+            with self._refresh_lock:
+                self._ui_refresh_pending = False
             if self._config_window is not None:
                 self._config_window.refresh()
 
@@ -1271,7 +1497,13 @@ class DictateApp:
     def _schedule_status_refresh(self) -> None:
         if self._controller is None:
             return
+        with self._refresh_lock:
+            if self._status_refresh_pending:
+                return
+            self._status_refresh_pending = True
         def refresh():
+            with self._refresh_lock:
+                self._status_refresh_pending = False
             if self._controller is not None:
                 self._controller.update_indicator()
 
@@ -1286,13 +1518,18 @@ class DictateApp:
     def _increment_transcribing(self) -> None:
         with self._transcribing_lock:
             self._transcribing_count += 1
-        self._schedule_status_refresh()
+            changed = self._transcribing_count == 1
+        if changed:
+            self._schedule_status_refresh()
 
     def _decrement_transcribing(self) -> None:
         with self._transcribing_lock:
-            if self._transcribing_count > 0:
-                self._transcribing_count -= 1
-        self._schedule_status_refresh()
+            if self._transcribing_count == 0:
+                return
+            self._transcribing_count -= 1
+            changed = self._transcribing_count == 0
+        if changed:
+            self._schedule_status_refresh()
 
     def _mark_model_used(self, model_id: str) -> None:
         with self._model_idle_lock:
@@ -1300,20 +1537,22 @@ class DictateApp:
             self._last_model_id = model_id
         self._schedule_model_unload()
 
-    def _schedule_model_unload(self) -> None:
+    def _schedule_model_unload(self, delay: float | None = None) -> None:
         with self._model_idle_lock:
-            if self._model_idle_timer is not None:
-                self._model_idle_timer.cancel()
-                self._model_idle_timer = None
+            if self._model_idle_call is not None:
+                self._model_idle_call.cancel()
+                self._model_idle_call = None
             if self._model_idle_seconds <= 0:
                 return
-            timer = threading.Timer(
-                self._model_idle_seconds,
+            self._model_idle_call = self._scheduler.call_later(
+                self._model_idle_seconds if delay is None else delay,
                 self._handle_model_idle_timeout,
             )
-            timer.daemon = True
-            self._model_idle_timer = timer
-            timer.start()
+
+    def _can_unload_model(self, model_id: str) -> bool:
+        if self._recording or self.transcribing or self._model_loading:
+            return False
+        return model_id == self.current_model_id
 
     def _handle_model_idle_timeout(self) -> None:
         with self._model_idle_lock:
@@ -1323,19 +1562,20 @@ class DictateApp:
             last_model_id = self._last_model_id
         if last_model_id is None:
             return
-        if time.monotonic() - last_use < self._model_idle_seconds:
-            self._schedule_model_unload()
+        remaining = last_use + self._model_idle_seconds - time.monotonic()
+        if remaining > 0:
+            self._schedule_model_unload(remaining)
             return
-        if self._recording or self.transcribing or self._model_loading:
-            self._schedule_model_unload()
-            return
-        if last_model_id != self.current_model_id:
+        self._background_executor.submit(self._unload_idle_model, last_model_id)
+
+    def _unload_idle_model(self, model_id: str) -> None:
+        if not self._can_unload_model(model_id):
             self._schedule_model_unload()
             return
-        if unload_model(last_model_id):
-            logging.getLogger(__name__).info(
+        if unload_model(model_id):
+            _LOGGER.info(
                 "Model unloaded after idle timeout: %s",
-                last_model_id,
+                model_id,
             )
 
     def toggle_recording(self) -> None:
@@ -1343,7 +1583,7 @@ class DictateApp:
             if self._cancel_pending_transcription():
                 return
             if self._model_loading:
-                logging.getLogger(__name__).info(
+                _LOGGER.info(
                     "Recording ignored while model is loading."
                 )
                 return
@@ -1352,75 +1592,65 @@ class DictateApp:
             try:
                 path = self._audio.stop()
             except RuntimeError as exc:
-                logging.getLogger(__name__).error("%s", exc)
+                _LOGGER.error("%s", exc)
                 path = None
             if path is not None:
-                logging.getLogger(__name__).info("Recording stopped: %s", path)
+                _LOGGER.info("Recording stopped: %s", path)
                 self._schedule_transcription(path)
         else:
             try:
                 path = self._audio.start()
             except RuntimeError as exc:
-                logging.getLogger(__name__).error("%s", exc)
+                _LOGGER.error("%s", exc)
                 path = None
             if path is not None:
                 self._recording = True
-                logging.getLogger(__name__).info("Recording started: %s", path)
+                _LOGGER.info("Recording started: %s", path)
         if self._controller is not None:
             self._controller.update_indicator()
 
     def _schedule_transcription(self, audio_path: Path) -> None:
         with self._pending_stop_lock:
-            if self._pending_stop_timer is not None:
-                self._pending_stop_timer.cancel()
+            if self._pending_stop_call is not None:
+                self._pending_stop_call.cancel()
             self._pending_stop_path = audio_path
-            timer = threading.Timer(
+            self._pending_stop_call = self._scheduler.call_later(
                 self._stop_cancel_window_seconds,
                 self._finalize_transcription,
-                args=(audio_path,),
+                audio_path,
             )
-            timer.daemon = True
-            self._pending_stop_timer = timer
-            timer.start()
 
     def _finalize_transcription(self, audio_path: Path) -> None:
         with self._pending_stop_lock:
             if self._pending_stop_path != audio_path:
                 return
-            self._pending_stop_timer = None
+            self._pending_stop_call = None
             self._pending_stop_path = None
         self._start_transcription(audio_path)
 
     def _cancel_pending_transcription(self) -> bool:
         with self._pending_stop_lock:
-            if self._pending_stop_timer is None or self._pending_stop_path is None:
+            if self._pending_stop_call is None or self._pending_stop_path is None:
                 return False
-            timer = self._pending_stop_timer
+            self._pending_stop_call.cancel()
             audio_path = self._pending_stop_path
-            self._pending_stop_timer = None
+            self._pending_stop_call = None
             self._pending_stop_path = None
-        timer.cancel()
-        logger = logging.getLogger(__name__)
         try:
             audio_path.unlink()
         except FileNotFoundError:
             pass
         except Exception as exc:
-            logger.warning("Failed to delete canceled recording: %s", exc)
-        logger.info("Recording canceled: %s", audio_path)
+            _LOGGER.warning("Failed to delete canceled recording: %s", exc)
+        _LOGGER.info("Recording canceled: %s", audio_path)
         return True
 
     def _start_transcription(self, audio_path) -> None:
-        thread = threading.Thread(
-            target=self._transcribe_and_paste,
-            args=(audio_path,),
-            daemon=True,
-        )
-        thread.start()
+        self._executor.submit(self._transcribe_and_paste, audio_path)
 
     def _transcribe_and_paste(self, audio_path) -> None:
-        logger = logging.getLogger(__name__)
         self._increment_transcribing()
+        handed_off = False
         try:
             self._mark_model_used(self.current_model_id)
             text = transcribe_audio(
@@ -1436,27 +1666,44 @@ class DictateApp:
                 vad_rms_threshold=self._settings.vad_rms_threshold,
                 word_timestamps=self._settings.word_timestamps,
                 hallucination_silence_threshold=self._settings.hallucination_silence_threshold,
-                language_override=self._language_override,
+                language_override=self._config.language,
             )
+            self._postprocess_executor.submit(
+                self._finish_transcript,
+                audio_path,
+                text,
+                self._config.postprocess_enabled,
+            )
+            handed_off = True
+        except Exception as exc:
+            _LOGGER.error("Transcription failed: %s", exc)
+        finally:
+            if not handed_off:
+                self._decrement_transcribing()
+
+    def _finish_transcript(
+        self, audio_path, text: str, postprocess_enabled: bool
+    ) -> None:
+        try:
             original_text = text
             polished_text = ""
-            if text and self._postprocess_enabled:
+            if text and postprocess_enabled:
                 try:
                     text = postprocess_text(text, self._build_postprocess_config())
                     polished_text = text
                 except Exception as exc:
-                    logger.error("Post-processing failed: %s", exc)
+                    _LOGGER.error("Post-processing failed: %s", exc)
             json_path = write_transcript_json(
                 audio_path,
                 text,
                 original_text=original_text,
                 polished_text=polished_text,
             )
-            logger.info("Saved transcript: %s", json_path)
+            _LOGGER.info("Saved transcript: %s", json_path)
             if text:
                 paste_text(text)
         except Exception as exc:
-            logger.error("Transcription failed: %s", exc)
+            _LOGGER.error("Saving transcript failed: %s", exc)
         finally:
             self._decrement_transcribing()
 
@@ -1464,14 +1711,20 @@ class DictateApp:
         app = NSApplication.sharedApplication()
         app.setActivationPolicy_(NSApplicationActivationPolicyAccessory)
         self._controller = StatusBarController.alloc().initWithApp_(self)
-        if self._pending_permission_notice and self._is_accessibility_trusted():
-            self._clear_pending_permission_notice()
+        trusted = None
+        if self._pending_permission_notice:
+            trusted = self._is_accessibility_trusted()
+            if trusted:
+                self._clear_pending_permission_notice()
         try:
             self._hotkeys.start()
         except RuntimeError as exc:
-            logging.getLogger(__name__).warning("%s", exc)
+            _LOGGER.warning("%s", exc)
         if self._pending_permission_notice:
             NSOperationQueue.mainQueue().addOperationWithBlock_(
-                self._show_permission_notice
+                lambda: self._show_permission_notice(trusted)
             )
-        app.run()
+        try:
+            app.run()
+        finally:
+            self.shutdown()
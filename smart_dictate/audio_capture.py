@@ -1,20 +1,14 @@
 from __future__ import annotations
 
-from datetime import datetime
+import os
 from pathlib import Path
+import time
+from typing import TYPE_CHECKING
 
-from AVFoundation import (
-    AVAudioQualityHigh,
-    AVAudioRecorder,
-    AVEncoderAudioQualityKey,
-    AVFormatIDKey,
-    AVLinearPCMBitDepthKey,
-    AVLinearPCMIsBigEndianKey,
-    AVLinearPCMIsFloatKey,
-    AVNumberOfChannelsKey,
-    AVSampleRateKey,
-)
-from Foundation import NSURL
+from Foundation import NSDictionary, NSURL
+
+if TYPE_CHECKING:
+    from AVFoundation import AVAudioRecorder
 
 K_AUDIO_FORMAT_LINEAR_PCM = int.from_bytes(b"lpcm", "big")
 
@@ -27,26 +21,74 @@ class AudioCapture:
         self._active = False
         self._recorder: AVAudioRecorder | None = None
         self._current_path: Path | None = None
+        self._scratch_path = output_dir / ".recording.wav"
+        self._settings: NSDictionary | None = None
+        self._recorder_input: str | None = None
 
     def start(self) -> Path:
         if self._active:
             raise RuntimeError("Recording already active.")
         self._output_dir.mkdir(parents=True, exist_ok=True)
-        filename = datetime.now().strftime("recording_%Y%m%d_%H%M%S.wav")
+        filename = time.strftime("recording_%Y%m%d_%H%M%S.wav")
+        recorder = self._prepared_recorder()
+        if not recorder.record():
+            self._recorder = None
+            raise RuntimeError("Recorder start failed.")
         self._current_path = self._output_dir / filename
-        url = NSURL.fileURLWithPath_(str(self._current_path))
-        settings = {
-            AVFormatIDKey: K_AUDIO_FORMAT_LINEAR_PCM,
-            AVSampleRateKey: float(self._sample_rate_hz),
-            AVNumberOfChannelsKey: int(self._channels),
-            AVLinearPCMBitDepthKey: 16,
-            AVLinearPCMIsBigEndianKey: False,
-            AVLinearPCMIsFloatKey: False,
-            AVEncoderAudioQualityKey: AVAudioQualityHigh,
-        }
+        self._active = True
+        return self._current_path
+
+    def stop(self) -> Path | None:
+        if not self._active or self._recorder is None:
+            return self._current_path
+        self._recorder.stop()
+        self._active = False
+        try:
+            os.replace(self._scratch_path, self._current_path)
+        except OSError as exc:
+            self._recorder = None
+            raise RuntimeError(f"Failed to save recording: {exc}") from exc
+        if not self._recorder.prepareToRecord():
+            self._recorder = None
+        return self._current_path
+
+    def _prepared_recorder(self) -> AVAudioRecorder:
+        input_uid = _default_input_uid()
+        if (
+            self._recorder is not None
+            and self._recorder_input == input_uid
+            and self._scratch_path.exists()
+        ):
+            return self._recorder
+        self._recorder = None
+        from AVFoundation import (
+            AVAudioQualityHigh,
+            AVAudioRecorder,
+            AVEncoderAudioQualityKey,
+            AVFormatIDKey,
+            AVLinearPCMBitDepthKey,
+            AVLinearPCMIsBigEndianKey,
+            AVLinearPCMIsFloatKey,
+            AVNumberOfChannelsKey,
+            AVSampleRateKey,
+        )
+
+        if self._settings is None:
+            self._settings = NSDictionary.dictionaryWithDictionary_(
+                {
+                    AVFormatIDKey: K_AUDIO_FORMAT_LINEAR_PCM,
+                    AVSampleRateKey: float(self._sample_rate_hz),
+                    AVNumberOfChannelsKey: int(self._channels),
+                    AVLinearPCMBitDepthKey: 16,
+                    AVLinearPCMIsBigEndianKey: False,
+                    AVLinearPCMIsFloatKey: False,
+                    AVEncoderAudioQualityKey: AVAudioQualityHigh,
+                }
+            )
+        url = NSURL.fileURLWithPath_(str(self._scratch_path))
         recorder, error = AVAudioRecorder.alloc().initWithURL_settings_error_(
             url,
-            settings,
+            self._settings,
             None,
         )
         if error is not None:
@@ -55,15 +97,15 @@ class AudioCapture:
             raise RuntimeError("Failed to create recorder.")
         if not recorder.prepareToRecord():
             raise RuntimeError("Recorder prepareToRecord failed.")
-        if not recorder.record():
-            raise RuntimeError("Recorder start failed.")
         self._recorder = recorder
-        self._active = True
-        return self._current_path
+        self._recorder_input = input_uid
+        return recorder
 
-    def stop(self) -> Path | None:
-        if not self._active or self._recorder is None:
-            return self._current_path
-        self._recorder.stop()
-        self._active = False
-        return self._current_path
+
+def _default_input_uid() -> str | None:
+    from AVFoundation import AVCaptureDevice, AVMediaTypeAudio
+
+    device = AVCaptureDevice.defaultDeviceWithMediaType_(AVMediaTypeAudio)
+    if device is None:
+        return None
+    return str(device.uniqueID())
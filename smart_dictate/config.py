@@ -1,8 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+import os
 from pathlib import Path
-import tomllib
+import re
+
+_SECTION_RE = re.compile(r"^\[([a-z_]+)\]\s*$")
+_KV_RE = re.compile(r'^([a-z_]+)\s*=\s*"((?:[^"\\]|\\.)*)"\s*$')
+_ESCAPE_RE = re.compile(r"\\(.)")
+_UNESCAPES = {
+    "\\": "\\",
+    "b": "\b",
+    "t": "\t",
+    "n": "\n",
+    "f": "\f",
+    "r": "\r",
+    '"': '"',
+}
+_TOML_ESCAPE = str.maketrans({value: "\\" + key for key, value in _UNESCAPES.items()})
 
 
 @dataclass(frozen=True)
@@ -11,6 +27,9 @@ class AppConfig:
     model_id: str | None = None
     model_idle_minutes: int | None = None
     app_hash: str | None = None
+    app_path: str | None = None
+    app_size: int | None = None
+    app_mtime_ns: int | None = None
     postprocess_enabled: bool = False
     postprocess_base_url: str | None = None
     postprocess_model: str | None = None
@@ -21,27 +40,127 @@ class AppConfig:
 
 
 def _toml_quote(value: str) -> str:
-    escaped = (
-        value.replace("\\", "\\\\")
-        .replace("\b", "\\b")
-        .replace("\t", "\\t")
-        .replace("\n", "\\n")
-        .replace("\f", "\\f")
-        .replace("\r", "\\r")
-        .replace('"', '\\"')
-    )
-    return f"\"{escaped}\""
+    return f"\"{value.translate(_TOML_ESCAPE)}\""
+
+
+def _unescape(match: re.Match) -> str:
+    return _UNESCAPES[match.group(1)]
+
+
+def _parse_flat_toml(text: str) -> dict | None:
+    data: dict[str, dict[str, str]] = {}
+    section: dict[str, str] | None = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        match = _SECTION_RE.match(line)
+        if match is not None:
+            section = data.setdefault(match.group(1), {})
+            continue
+        match = _KV_RE.match(line)
+        if match is None or section is None:
+            return None
+        try:
+            section[match.group(1)] = _ESCAPE_RE.sub(_unescape, match.group(2))
+        except KeyError:
+            return None
+    return data
+
+
+def _keyword_none_str(keyword: str):
+    def coerce(value) -> str | None:
+        if not value or str(value).lower() == keyword:
+            return None
+        return str(value)
+
+    return coerce
+
+
+def _idle_minutes(value) -> int | None:
+    if value is None or str(value).lower() in {"", "default"}:
+        return None
+    try:
+        minutes = int(value)
+    except (TypeError, ValueError):
+        return None
+    return minutes if minutes >= 0 else None
+
+
+def _opt_int(value) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _opt_str(value) -> str | None:
+    return str(value) if value else None
+
+
+def _nonempty_str(value) -> str | None:
+    return value if isinstance(value, str) and value else None
+
+
+def _stripped_str(value) -> str | None:
+    if isinstance(value, str):
+        value = value.strip()
+        if value:
+            return value
+    return None
+
+
+def _flex_bool(value) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+_FIELDS = (
+    ("transcription", "language", "language", _keyword_none_str("auto")),
+    ("transcription", "model_id", "model_id", _keyword_none_str("default")),
+    ("transcription", "model_idle_minutes", "model_idle_minutes", _idle_minutes),
+    ("app", "hash", "app_hash", _opt_str),
+    ("app", "path", "app_path", _nonempty_str),
+    ("app", "size", "app_size", _opt_int),
+    ("app", "mtime_ns", "app_mtime_ns", _opt_int),
+    ("postprocess", "enabled", "postprocess_enabled", _flex_bool),
+    ("postprocess", "base_url", "postprocess_base_url", _stripped_str),
+    ("postprocess", "model", "postprocess_model", _stripped_str),
+    ("postprocess", "system_prompt", "postprocess_system_prompt", _stripped_str),
+    ("hotkey", "modifiers", "hotkey_modifiers", _opt_int),
+    ("hotkey", "keycode", "hotkey_keycode", _opt_int),
+    ("hotkey", "label", "hotkey_label", _stripped_str),
+)
 
 
 def load_config(path: Path) -> AppConfig:
+    for candidate in (path, path.with_suffix(path.suffix + ".bak")):
+        try:
+            stat = os.stat(candidate)
+        except OSError:
+            continue
+        return _load_cached(str(candidate), stat.st_mtime_ns, stat.st_size)
+    return AppConfig()
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> AppConfig:
     def _read_toml(file_path: Path) -> dict | None:
         try:
-            return tomllib.loads(file_path.read_text(encoding="utf-8"))
+            text = file_path.read_bytes().decode("utf-8")
+            data = _parse_flat_toml(text)
+            if data is not None:
+                return data
+            import tomllib
+
+            return tomllib.loads(text)
         except Exception:
             return None
 
-    if not path.exists():
-        return AppConfig()
+    path = Path(path_str)
     data = _read_toml(path)
     if data is None:
         backup_path = path.with_suffix(path.suffix + ".bak")
@@ -49,85 +168,11 @@ def load_config(path: Path) -> AppConfig:
             data = _read_toml(backup_path)
         if data is None:
             return AppConfig()
-    transcription = data.get("transcription", {})
-    app = data.get("app", {})
-    postprocess = data.get("postprocess", {})
-    hotkey = data.get("hotkey", {})
-    language = transcription.get("language")
-    model_id = transcription.get("model_id")
-    idle_minutes = transcription.get("model_idle_minutes")
-    app_hash = app.get("hash")
-    postprocess_enabled = postprocess.get("enabled", False)
-    postprocess_base_url = postprocess.get("base_url")
-    postprocess_model = postprocess.get("model")
-    postprocess_system_prompt = postprocess.get("system_prompt")
-    if not language or str(language).lower() == "auto":
-        language = None
-    else:
-        language = str(language)
-    if not model_id or str(model_id).lower() == "default":
-        model_id = None
-    else:
-        model_id = str(model_id)
-    if idle_minutes is None or str(idle_minutes).lower() in {"", "default"}:
-        idle_minutes = None
-    else:
-        try:
-            idle_minutes = int(idle_minutes)
-        except (TypeError, ValueError):
-            idle_minutes = None
-        else:
-            if idle_minutes < 0:
-                idle_minutes = None
-    modifiers = hotkey.get("modifiers")
-    keycode = hotkey.get("keycode")
-    label = hotkey.get("label")
-    try:
-        modifiers = int(modifiers) if modifiers is not None else None
-    except (TypeError, ValueError):
-        modifiers = None
-    try:
-        keycode = int(keycode) if keycode is not None else None
-    except (TypeError, ValueError):
-        keycode = None
-    if isinstance(label, str) and label.strip():
-        label = label.strip()
-    else:
-        label = None
-    if isinstance(postprocess_enabled, str):
-        postprocess_enabled = postprocess_enabled.strip().lower() in {
-            "1",
-            "true",
-            "yes",
-            "on",
-        }
-    else:
-        postprocess_enabled = bool(postprocess_enabled)
-    if isinstance(postprocess_base_url, str) and postprocess_base_url.strip():
-        postprocess_base_url = postprocess_base_url.strip()
-    else:
-        postprocess_base_url = None
-    if isinstance(postprocess_model, str) and postprocess_model.strip():
-        postprocess_model = postprocess_model.strip()
-    else:
-        postprocess_model = None
-    if isinstance(postprocess_system_prompt, str) and postprocess_system_prompt.strip():
-        postprocess_system_prompt = postprocess_system_prompt.strip()
-    else:
-        postprocess_system_prompt = None
-    return AppConfig(
-        language=language,
-        model_id=model_id,
-        model_idle_minutes=idle_minutes,
-        app_hash=str(app_hash) if app_hash else None,
-        postprocess_enabled=postprocess_enabled,
-        postprocess_base_url=postprocess_base_url,
-        postprocess_model=postprocess_model,
-        postprocess_system_prompt=postprocess_system_prompt,
-        hotkey_modifiers=modifiers,
-        hotkey_keycode=keycode,
-        hotkey_label=label,
-    )
+    kwargs = {}
+    for section_name, key, field, coerce in _FIELDS:
+        section = data.get(section_name)
+        kwargs[field] = coerce(section.get(key) if isinstance(section, dict) else None)
+    return AppConfig(**kwargs)
 
 
 def save_config(path: Path, config: AppConfig) -> None:
@@ -140,6 +185,9 @@ def save_config(path: Path, config: AppConfig) -> None:
         else str(config.model_idle_minutes)
     )
     app_hash = config.app_hash or ""
+    app_path = config.app_path or ""
+    app_size = "" if config.app_size is None else str(config.app_size)
+    app_mtime_ns = "" if config.app_mtime_ns is None else str(config.app_mtime_ns)
     postprocess_enabled = "true" if config.postprocess_enabled else "false"
     postprocess_base_url = config.postprocess_base_url or ""
     postprocess_model = config.postprocess_model or ""
@@ -147,30 +195,57 @@ def save_config(path: Path, config: AppConfig) -> None:
     modifiers = "" if config.hotkey_modifiers is None else str(config.hotkey_modifiers)
     keycode = "" if config.hotkey_keycode is None else str(config.hotkey_keycode)
     label = config.hotkey_label or ""
-    content = (
-        "[app]\n"
-        f"hash = {_toml_quote(app_hash)}\n"
-        "\n"
-        "[postprocess]\n"
-        f"enabled = {_toml_quote(postprocess_enabled)}\n"
-        f"base_url = {_toml_quote(postprocess_base_url)}\n"
-        f"model = {_toml_quote(postprocess_model)}\n"
-        f"system_prompt = {_toml_quote(postprocess_system_prompt)}\n"
-        "\n"
-        "[transcription]\n"
-        f"language = {_toml_quote(language)}\n"
-        f"model_id = {_toml_quote(model_id)}\n"
-        f"model_idle_minutes = {_toml_quote(idle_minutes)}\n"
-        "\n"
-        "[hotkey]\n"
-        f"modifiers = {_toml_quote(modifiers)}\n"
-        f"keycode = {_toml_quote(keycode)}\n"
-        f"label = {_toml_quote(label)}\n"
+    sections = (
+        (
+            "app",
+            (
+                ("hash", app_hash),
+                ("path", app_path),
+                ("size", app_size),
+                ("mtime_ns", app_mtime_ns),
+            ),
+        ),
+        (
+            "postprocess",
+            (
+                ("enabled", postprocess_enabled),
+                ("base_url", postprocess_base_url),
+                ("model", postprocess_model),
+                ("system_prompt", postprocess_system_prompt),
+            ),
+        ),
+        (
+            "transcription",
+            (
+                ("language", language),
+                ("model_id", model_id),
+                ("model_idle_minutes", idle_minutes),
+            ),
+        ),
+        (
+            "hotkey",
+            (
+                ("modifiers", modifiers),
+                ("keycode", keycode),
+                ("label", label),
+            ),
+        ),
     )
-    if path.exists():
-        backup_path = path.with_suffix(path.suffix + ".bak")
-        try:
-            backup_path.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
-        except Exception:
-            pass
-    path.write_text(content, encoding="utf-8")
+    parts: list[str] = []
+    for name, values in sections:
+        if parts:
+            parts.append("")
+        parts.append(f"[{name}]")
+        parts.extend(f"{key} = {_toml_quote(value)}" for key, value in values)
+    content = "\n".join(parts) + "\n"
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(content.encode("utf-8"))
+        handle.flush()
+        os.fsync(handle.fileno())
+    try:
+        os.replace(path, path.with_suffix(path.suffix + ".bak"))
+    except FileNotFoundError:
+        pass
+    os.replace(tmp_path, path)
+    _load_cached.cache_clear()
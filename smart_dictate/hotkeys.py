@@ -18,6 +18,25 @@ CG_MODIFIER_MASK = (
 )
 KEYCODE_FIELD = Quartz.kCGKeyboardEventKeycode
 FN_DOUBLE_TAP_SECONDS = 0.2
+_FLAGS_CHANGED = Quartz.kCGEventFlagsChanged
+_KEY_DOWN = Quartz.kCGEventKeyDown
+_KEY_UP = Quartz.kCGEventKeyUp
+_FN_MASK = Quartz.kCGEventFlagMaskSecondaryFn
+_TAP_DISABLED_EVENTS = frozenset(
+    (
+        Quartz.kCGEventTapDisabledByTimeout,
+        Quartz.kCGEventTapDisabledByUserInput,
+    )
+)
+_HANDLED_EVENTS = frozenset((_FLAGS_CHANGED, _KEY_DOWN, _KEY_UP))
+_MODIFIER_EVENT_MASK = Quartz.CGEventMaskBit(_FLAGS_CHANGED)
+_KEY_EVENT_MASK = (
+    _MODIFIER_EVENT_MASK
+    | Quartz.CGEventMaskBit(_KEY_DOWN)
+    | Quartz.CGEventMaskBit(_KEY_UP)
+)
+_event_flags = Quartz.CGEventGetFlags
+_event_int_field = Quartz.CGEventGetIntegerValueField
 
 
 @dataclass(frozen=True)
@@ -26,6 +45,22 @@ class Hotkey:
     keycode: int | None = None
 
 
+_DEFAULT_HOTKEY = Hotkey(DEFAULT_HOTKEY_MODIFIERS)
+_KEYCODE_LABELS = {
+    **{keycode: f"F{keycode - 111}" for keycode in range(122, 134)},
+    36: "Enter",
+    48: "Tab",
+    49: "Space",
+    51: "Backspace",
+    53: "Esc",
+    57: "CapsLock",
+    123: "Left",
+    124: "Right",
+    125: "Down",
+    126: "Up",
+}
+
+
 class HotkeyManager:
     def __init__(self, on_toggle: Callable[[], None]) -> None:
         self._on_toggle = on_toggle
@@ -38,18 +73,34 @@ class HotkeyManager:
         self._registered: list[Hotkey] = []
 
     def register(self, hotkey: Hotkey) -> None:
+        previous = self._registered
+        previous_mask = self._event_mask()
         self._registered = [hotkey]
         self._hotkey_down = False
+        mask = self._event_mask()
+        if self._tap is None or mask == previous_mask:
+            return
+        try:
+            tap, source = self._create_tap(mask)
+        except RuntimeError:
+            self._registered = previous
+            raise
+        self.stop()
+        self._install_tap(tap, source)
+
+    def _event_mask(self) -> int:
+        if self._registered and self._registered[0].keycode is not None:
+            return _KEY_EVENT_MASK
+        return _MODIFIER_EVENT_MASK
 
     def start(self) -> None:
         if self._tap is not None:
             return
-        mask = (
-            Quartz.CGEventMaskBit(Quartz.kCGEventFlagsChanged)
-            | Quartz.CGEventMaskBit(Quartz.kCGEventKeyDown)
-            | Quartz.CGEventMaskBit(Quartz.kCGEventKeyUp)
-        )
-        self._tap = Quartz.CGEventTapCreate(
+        tap, source = self._create_tap(self._event_mask())
+        self._install_tap(tap, source)
+
+    def _create_tap(self, mask: int):
+        tap = Quartz.CGEventTapCreate(
             Quartz.kCGHIDEventTap,
             Quartz.kCGHeadInsertEventTap,
             Quartz.kCGEventTapOptionDefault,
@@ -57,9 +108,13 @@ class HotkeyManager:
             self._event_callback,
             None,
         )
-        if self._tap is None:
+        if tap is None:
             raise RuntimeError("Failed to create event tap. Check Accessibility permissions.")
-        self._source = Quartz.CFMachPortCreateRunLoopSource(None, self._tap, 0)
+        return tap, Quartz.CFMachPortCreateRunLoopSource(None, tap, 0)
+
+    def _install_tap(self, tap, source) -> None:
+        self._tap = tap
+        self._source = source
         self._run_loop = Quartz.CFRunLoopGetCurrent()
         Quartz.CFRunLoopAddSource(
             self._run_loop,
@@ -78,32 +133,26 @@ class HotkeyManager:
                 self._source,
                 Quartz.kCFRunLoopCommonModes,
             )
+        Quartz.CFMachPortInvalidate(self._tap)
         self._tap = None
         self._source = None
         self._run_loop = None
 
     def _event_callback(self, _proxy, event_type, event, _refcon):
-        if event_type in (
-            Quartz.kCGEventTapDisabledByTimeout,
-            Quartz.kCGEventTapDisabledByUserInput,
-        ):
-            if self._tap is not None:
+        if event_type not in _HANDLED_EVENTS:
+            if event_type in _TAP_DISABLED_EVENTS and self._tap is not None:
                 Quartz.CGEventTapEnable(self._tap, True)
             return event
-        if event_type not in (
-            Quartz.kCGEventFlagsChanged,
-            Quartz.kCGEventKeyDown,
-            Quartz.kCGEventKeyUp,
-        ):
-            return event
 
-        flags = Quartz.CGEventGetFlags(event) & CG_MODIFIER_MASK
-        hotkey = self._registered[0] if self._registered else Hotkey(DEFAULT_HOTKEY_MODIFIERS)
-        if hotkey.keycode is None:
-            if event_type != Quartz.kCGEventFlagsChanged:
+        hotkey = self._registered[0] if self._registered else _DEFAULT_HOTKEY
+        hotkey_keycode = hotkey.keycode
+        hotkey_modifiers = hotkey.modifiers
+        if event_type == _FLAGS_CHANGED:
+            if hotkey_keycode is not None:
                 return event
-            if hotkey.modifiers == Quartz.kCGEventFlagMaskSecondaryFn:
-                fn_now = (flags & Quartz.kCGEventFlagMaskSecondaryFn) != 0
+            flags = _event_flags(event) & CG_MODIFIER_MASK
+            if hotkey_modifiers == _FN_MASK:
+                fn_now = (flags & _FN_MASK) != 0
                 if fn_now and not self._fn_down:
                     now = time.monotonic()
                     if now - self._fn_last_press <= FN_DOUBLE_TAP_SECONDS:
@@ -115,22 +164,27 @@ class HotkeyManager:
                 elif not fn_now and self._fn_down:
                     self._fn_down = False
                 return event
-            hotkey_now = flags == hotkey.modifiers
+            hotkey_now = flags == hotkey_modifiers
             if hotkey_now and not self._hotkey_down:
                 self._hotkey_down = True
                 self._on_toggle()
             elif not hotkey_now and self._hotkey_down:
                 self._hotkey_down = False
             return event
-        keycode = Quartz.CGEventGetIntegerValueField(event, KEYCODE_FIELD)
-        if event_type == Quartz.kCGEventKeyUp:
-            if keycode == hotkey.keycode:
-                self._hotkey_down = False
+
+        if hotkey_keycode is None:
             return event
-        if event_type == Quartz.kCGEventKeyDown:
-            if keycode == hotkey.keycode and flags == hotkey.modifiers and not self._hotkey_down:
-                self._hotkey_down = True
-                self._on_toggle()
+        if _event_int_field(event, KEYCODE_FIELD) != hotkey_keycode:
+            return event
+        if event_type == _KEY_UP:
+            self._hotkey_down = False
+            return event
+        if (
+            not self._hotkey_down
+            and _event_flags(event) & CG_MODIFIER_MASK == hotkey_modifiers
+        ):
+            self._hotkey_down = True
+            self._on_toggle()
         return event
 
 
@@ -155,20 +209,7 @@ def format_hotkey(modifiers: int, keycode: int | None, key_label: str | None = N
 
 
 def _keycode_label(keycode: int) -> str:
-    mapping = {
-        36: "Enter",
-        48: "Tab",
-        49: "Space",
-        51: "Backspace",
-        53: "Esc",
-        57: "CapsLock",
-        123: "Left",
-        124: "Right",
-        125: "Down",
-        126: "Up",
-    }
-    if keycode in mapping:
-        return mapping[keycode]
-    if 122 <= keycode <= 133:
-        return f"F{keycode - 111}"
-    return f"Key{keycode}"
+    label = _KEYCODE_LABELS.get(keycode)
+    if label is None:
+        return f"Key{keycode}"
+    return label
@@ -2,12 +2,35 @@ from __future__ import annotations
 
 import logging
 import subprocess
+import threading
 
 SERVICE_NAME = "com.anfedoro.smartdictate"
 ACCOUNT_NAME = "postprocess-api-key"
 
+_CLI_ITEM_NOT_FOUND = 44
+
+_CACHE_LOCK = threading.Lock()
+_cached_key: str | None = None
+_cached_valid = False
+
+
+def _store_cached_key(key: str | None) -> None:
+    global _cached_key, _cached_valid
+    _cached_key = key
+    _cached_valid = True
+
 
 def get_postprocess_api_key() -> str | None:
+    with _CACHE_LOCK:
+        if _cached_valid:
+            return _cached_key
+        key, definitive = _cli_read()
+        if definitive:
+            _store_cached_key(key)
+        return key
+
+
+def _cli_read() -> tuple[str | None, bool]:
     try:
         result = subprocess.run(
             [
@@ -23,13 +46,21 @@ def get_postprocess_api_key() -> str | None:
             capture_output=True,
             text=True,
         )
-    except subprocess.CalledProcessError:
-        return None
+    except subprocess.CalledProcessError as exc:
+        if exc.returncode == _CLI_ITEM_NOT_FOUND:
+            return None, True
+        return None, False
     key = result.stdout.strip()
-    return key or None
+    return key or None, True
 
 
 def set_postprocess_api_key(api_key: str) -> None:
+    with _CACHE_LOCK:
+        _cli_write(api_key)
+        _store_cached_key(api_key.strip() or None)
+
+
+def _cli_write(api_key: str) -> None:
     try:
         subprocess.run(
             [
@@ -57,6 +88,12 @@ def set_postprocess_api_key(api_key: str) -> None:
 
 
 def delete_postprocess_api_key() -> None:
+    with _CACHE_LOCK:
+        _cli_delete()
+        _store_cached_key(None)
+
+
+def _cli_delete() -> None:
     try:
         subprocess.run(
             [
@@ -73,3 +110,4 @@ def delete_postprocess_api_key() -> None:
         )
     except subprocess.CalledProcessError:
         return
+
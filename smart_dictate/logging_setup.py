@@ -1,21 +1,68 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 
 from smart_dictate.paths import base_dir
 
+_LISTENER: logging.handlers.QueueListener | None = None
+_QUEUE_HANDLER: logging.handlers.QueueHandler | None = None
+_ATEXIT_REGISTERED = False
+
 
 def setup_logging(level: int = logging.INFO) -> None:
+    global _LISTENER, _QUEUE_HANDLER, _ATEXIT_REGISTERED
+    shutdown_logging()
     log_dir = base_dir()
     log_dir.mkdir(parents=True, exist_ok=True)
     log_path = log_dir / "smart-dictate.log"
-    handlers = [
-        logging.FileHandler(log_path, encoding="utf-8"),
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _LISTENER = logging.handlers.QueueListener(
+        log_queue,
+        logging.handlers.MemoryHandler(
+            capacity=64,
+            flushLevel=logging.WARNING,
+            target=logging.FileHandler(log_path, encoding="utf-8"),
+        ),
         logging.StreamHandler(),
-    ]
+        respect_handler_level=True,
+    )
+    _LISTENER.start()
+    if not _ATEXIT_REGISTERED:
+        atexit.register(shutdown_logging)
+        _ATEXIT_REGISTERED = True
+    _QUEUE_HANDLER = logging.handlers.QueueHandler(log_queue)
     logging.basicConfig(
         level=level,
         format="%(levelname)s %(name)s: %(message)s",
-        handlers=handlers,
+        handlers=[_QUEUE_HANDLER],
         force=True,
     )
+
+
+def shutdown_logging() -> None:
+    global _LISTENER, _QUEUE_HANDLER
+    listener = _LISTENER
+    if listener is None:
+        return
+    _LISTENER = None
+    if _QUEUE_HANDLER is not None:
+        logging.getLogger().removeHandler(_QUEUE_HANDLER)
+        _QUEUE_HANDLER.close()
+        _QUEUE_HANDLER = None
+    listener.stop()
+    for handler in listener.handlers:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+
+
+def flush_logging() -> None:
+    listener = _LISTENER
+    if listener is None:
+        return
+    for handler in listener.handlers:
+        handler.flush()
@@ -3,10 +3,13 @@ from __future__ import annotations
 import logging
 import os
 import plistlib
+import shlex
 import subprocess
 import sys
 from pathlib import Path
 
+from smart_dictate.paths import base_dir
+
 LOGIN_ITEM_LABEL = "com.anfedoro.smartdictate.login"
 
 
@@ -25,44 +28,50 @@ def ensure_login_item_start() -> None:
         "LimitLoadToSessionType": ["Aqua"],
         "WorkingDirectory": str(executable.parent),
     }
+    expected = plistlib.dumps(payload, sort_keys=True)
+    sentinel_path = base_dir() / ".login_item_ok"
     try:
-        current = None
-        if agent_path.exists():
-            current = plistlib.loads(agent_path.read_bytes())
-        if current != payload:
+        try:
+            current = agent_path.read_bytes()
+        except FileNotFoundError:
+            current = None
+        if current != expected:
+            sentinel_path.unlink(missing_ok=True)
             agent_path.parent.mkdir(parents=True, exist_ok=True)
-            agent_path.write_bytes(plistlib.dumps(payload, sort_keys=True))
+            agent_path.write_bytes(expected)
+        elif sentinel_path.exists():
+            return
     except Exception as exc:
         logger.warning("Failed to write launch agent plist: %s", exc)
         return
     uid = os.getuid()
     domain = f"gui/{uid}"
     service = f"{domain}/{LOGIN_ITEM_LABEL}"
+    bootstrap = f"launchctl bootstrap {shlex.quote(domain)} {shlex.quote(str(agent_path))}"
+    script = (
+        f"{{ {bootstrap} || {{ launchctl bootout {shlex.quote(service)}; {bootstrap}; }}; }} "
+        f"&& launchctl enable {shlex.quote(service)}"
+    )
     try:
-        bootstrap = subprocess.run(
-            ["launchctl", "bootstrap", domain, str(agent_path)],
-            check=False,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        if bootstrap.returncode != 0:
-            subprocess.run(
-                ["launchctl", "bootout", service],
-                check=False,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            subprocess.run(
-                ["launchctl", "bootstrap", domain, str(agent_path)],
-                check=False,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        subprocess.run(
-            ["launchctl", "enable", service],
+        result = subprocess.run(
+            ["/bin/sh", "-c", script],
             check=False,
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
         )
     except Exception as exc:
         logger.warning("Failed to register login item launch agent: %s", exc)
+        return
+    if result.returncode != 0:
+        logger.warning(
+            "Failed to register login item launch agent (exit %s): %s",
+            result.returncode,
+            result.stderr.strip(),
+        )
+        return
+    try:
+        sentinel_path.parent.mkdir(parents=True, exist_ok=True)
+        sentinel_path.touch()
+    except OSError as exc:
+        logger.warning("Failed to record login item registration: %s", exc)
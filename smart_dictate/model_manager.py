@@ -4,8 +4,6 @@ import os
 import threading
 from pathlib import Path
 
-from huggingface_hub import snapshot_download
-
 _MODEL_DOWNLOAD_LOCK = threading.Lock()
 
 
@@ -15,6 +13,8 @@ def ensure_model(model_id: str, cache_dir: Path) -> Path:
         target_dir = cache_dir / model_id.replace("/", "__")
         if target_dir.exists() and any(target_dir.iterdir()):
             return target_dir
+        from huggingface_hub import snapshot_download
+
         token = os.getenv("HF_TOKEN") or os.getenv("HUGGINGFACE_HUB_TOKEN")
         snapshot_download(
             repo_id=model_id,
@@ -4,9 +4,6 @@ import os
 import shutil
 from pathlib import Path
 
-from huggingface_hub import HfApi
-
-
 FALLBACK_MODELS = [
     "mlx-community/whisper-tiny",
     "mlx-community/whisper-base",
@@ -17,6 +14,8 @@ FALLBACK_MODELS = [
 
 
 def fetch_whisper_models() -> list[str]:
+    from huggingface_hub import HfApi
+
     token = os.getenv("HF_TOKEN") or os.getenv("HUGGINGFACE_HUB_TOKEN")
     api = HfApi(token=token)
     try:
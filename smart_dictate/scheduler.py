@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ScheduledCall:
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(
+        self,
+        deadline: float,
+        callback: Callable[..., None],
+        args: tuple,
+    ) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class DeadlineScheduler:
+    def __init__(self, name: str = "sd-scheduler") -> None:
+        self._name = name
+        self._heap: list[tuple[float, int, ScheduledCall]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+
+    def call_later(
+        self,
+        delay: float,
+        callback: Callable[..., None],
+        *args,
+    ) -> ScheduledCall:
+        call = ScheduledCall(time.monotonic() + delay, callback, args)
+        with self._cond:
+            if self._stopped:
+                call.cancel()
+                return call
+            heapq.heappush(self._heap, (call.deadline, next(self._counter), call))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=self._name,
+                    daemon=True,
+                )
+                self._thread.start()
+            elif self._heap[0][2] is call:
+                self._cond.notify()
+        return call
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            for _, _, call in self._heap:
+                call.cancel()
+            self._heap.clear()
+            self._cond.notify()
+
+    def _next_due(self) -> ScheduledCall | None:
+        with self._cond:
+            while not self._stopped:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                deadline, _, call = self._heap[0]
+                if call.cancelled:
+                    heapq.heappop(self._heap)
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    heapq.heappop(self._heap)
+                    return call
+                self._cond.wait(remaining)
+        return None
+
+    def _run(self) -> None:
+        while True:
+            call = self._next_due()
+            if call is None:
+                return
+            if call.cancelled:
+                continue
+            try:
+                call.callback(*call.args)
+            except Exception:
+                _LOGGER.exception("Scheduled callback failed")
@@ -4,10 +4,12 @@ import gc
 import importlib
 import json
 import logging
+import os
+import struct
 import sys
 import threading
 import types
-import wave
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 
 import numpy as np
@@ -15,12 +17,21 @@ import numpy as np
 from smart_dictate.model_manager import ensure_model
 from smart_dictate.paths import models_dir
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _MODEL_LOAD_LOCK = threading.Lock()
+_LOADED_MODELS: dict[str, tuple[Path, str, object]] = {}
+_TIMING_DEPS_AVAILABLE: bool | None = None
+_WAV_FMT = struct.Struct("<HHIIHH")
+_WAV_PCM_FORMATS = (0x0001, 0xFFFE)
 
 
 def warmup_model(model_id: str) -> None:
     model_path = ensure_model(model_id, models_dir())
-    _ensure_loaded_model(model_path, word_timestamps=False)
+    _ensure_loaded_model(model_id, model_path, word_timestamps=False)
 
 
 def unload_model(model_id: str) -> bool:
@@ -39,6 +50,7 @@ def unload_model(model_id: str) -> bool:
     with _MODEL_LOAD_LOCK:
         holder.model = None
         holder.model_path = None
+        _LOADED_MODELS.pop(model_id, None)
     gc.collect()
     try:
         import mlx.core as mx  # type: ignore
@@ -58,31 +70,50 @@ def unload_model(model_id: str) -> bool:
                 clear_metal_cache()
         except Exception:
             pass
-    gc.collect()
     return True
 
 
 def _prepare_mlx_whisper_timing_stub(word_timestamps: bool) -> None:
-    try:
-        import numba  # noqa: F401
-        from scipy import signal  # noqa: F401
+    global _TIMING_DEPS_AVAILABLE
+    if _TIMING_DEPS_AVAILABLE is None:
+        try:
+            import numba  # noqa: F401
+            from scipy import signal  # noqa: F401
+        except Exception:
+            _TIMING_DEPS_AVAILABLE = False
+        else:
+            _TIMING_DEPS_AVAILABLE = True
+    if _TIMING_DEPS_AVAILABLE:
         return
-    except Exception:
-        if word_timestamps:
-            logging.getLogger(__name__).warning(
-                "Word timestamps disabled because numba/scipy are missing."
-            )
-        if "mlx_whisper.timing" not in sys.modules:
-            timing = types.ModuleType("mlx_whisper.timing")
+    if word_timestamps:
+        logging.getLogger(__name__).warning(
+            "Word timestamps disabled because numba/scipy are missing."
+        )
+    if "mlx_whisper.timing" not in sys.modules:
+        timing = types.ModuleType("mlx_whisper.timing")
 
-            def add_word_timestamps(**_kwargs):
-                return None
+        def add_word_timestamps(**_kwargs):
+            return None
 
-            timing.add_word_timestamps = add_word_timestamps
-            sys.modules["mlx_whisper.timing"] = timing
+        timing.add_word_timestamps = add_word_timestamps
+        sys.modules["mlx_whisper.timing"] = timing
 
 
-def _ensure_loaded_model(model_path: Path, *, word_timestamps: bool) -> bool:
+def _resident_model_path(model_id: str) -> Path | None:
+    loaded = _LOADED_MODELS.get(model_id)
+    if loaded is None:
+        return None
+    model_path, model_path_str, holder = loaded
+    if getattr(holder, "model", None) is None:
+        return None
+    if getattr(holder, "model_path", None) != model_path_str:
+        return None
+    return model_path
+
+
+def _ensure_loaded_model(
+    model_id: str, model_path: Path, *, word_timestamps: bool
+) -> bool:
     _prepare_mlx_whisper_timing_stub(word_timestamps)
     try:
         mlx_transcribe = importlib.import_module("mlx_whisper.transcribe")
@@ -95,6 +126,7 @@ def _ensure_loaded_model(model_path: Path, *, word_timestamps: bool) -> bool:
     current_model = getattr(holder, "model", None)
     current_path = getattr(holder, "model_path", None)
     if current_model is not None and current_path == model_path_str:
+        _LOADED_MODELS[model_id] = (model_path, model_path_str, holder)
         return True
     with _MODEL_LOAD_LOCK:
         current_model = getattr(holder, "model", None)
@@ -104,6 +136,7 @@ def _ensure_loaded_model(model_path: Path, *, word_timestamps: bool) -> bool:
             if mx_module is None:
                 import mlx.core as mx_module
             holder.get_model(model_path_str, mx_module.float16)
+        _LOADED_MODELS[model_id] = (model_path, model_path_str, holder)
     return True
 
 
@@ -123,12 +156,21 @@ def transcribe_audio(
     word_timestamps: bool = False,
     hallucination_silence_threshold: float = 0.0,
 ) -> str:
-    model_path = ensure_model(model_id, models_dir())
     try:
         import mlx_whisper
     except ImportError as exc:
         raise RuntimeError("mlx-whisper is not installed.") from exc
-    _ensure_loaded_model(model_path, word_timestamps=word_timestamps)
+    model_path = _resident_model_path(model_id)
+    if model_path is None:
+        model_path = ensure_model(model_id, models_dir())
+        _ensure_loaded_model(model_id, model_path, word_timestamps=word_timestamps)
+    transcribe_kwargs = _transcribe_kwargs(
+        model_path,
+        condition_on_previous_text,
+        language_override,
+        word_timestamps,
+        hallucination_silence_threshold,
+    )
     if segment_on_silence:
         audio = _load_wav_mono(audio_path, sample_rate_hz)
         if audio is not None:
@@ -144,22 +186,10 @@ def transcribe_audio(
             return _transcribe_segments(
                 mlx_whisper,
                 audio,
-                model_path,
                 segments,
-                condition_on_previous_text,
-                language_override,
-                word_timestamps,
-                hallucination_silence_threshold,
+                transcribe_kwargs,
             )
-    result = _transcribe_once(
-        mlx_whisper,
-        str(audio_path),
-        model_path,
-        condition_on_previous_text,
-        language_override,
-        word_timestamps,
-        hallucination_silence_threshold,
-    )
+    result = mlx_whisper.transcribe(str(audio_path), **transcribe_kwargs)
     return _extract_text(result)
 
 
@@ -176,11 +206,14 @@ def write_transcript_json(
         "original_text": original_text or "",
         "polished_text": polished_text or "",
     }
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
     json_path = audio_path.with_suffix(".json")
-    json_path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    tmp_path = audio_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, json_path)
     return json_path
 
 
@@ -193,20 +226,45 @@ def _extract_text(result) -> str:
 
 
 def _load_wav_mono(audio_path: Path, sample_rate_hz: int) -> np.ndarray | None:
-    try:
-        with wave.open(str(audio_path), "rb") as wf:
-            if wf.getnchannels() != 1:
+    with open(audio_path, "rb") as fh:
+        header = fh.read(12)
+        if len(header) != 12 or header[:4] != b"RIFF" or header[8:] != b"WAVE":
+            return None
+        fmt = None
+        while True:
+            chunk_header = fh.read(8)
+            if len(chunk_header) != 8:
                 return None
-            if wf.getsampwidth() != 2:
-                return None
-            if wf.getframerate() != sample_rate_hz:
-                return None
-            frames = wf.readframes(wf.getnframes())
-    except wave.Error:
-        return None
-    if not frames:
-        return None
-    return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+            chunk_id = chunk_header[:4]
+            chunk_size = int.from_bytes(chunk_header[4:], "little")
+            if chunk_id == b"data":
+                break
+            padded_size = chunk_size + (chunk_size & 1)
+            if chunk_id == b"fmt ":
+                body = fh.read(padded_size)
+                if len(body) < _WAV_FMT.size:
+                    return None
+                fmt = _WAV_FMT.unpack_from(body)
+            else:
+                fh.seek(padded_size, os.SEEK_CUR)
+        if fmt is None:
+            return None
+        format_tag, channels, framerate, _, _, bits = fmt
+        if format_tag not in _WAV_PCM_FORMATS or channels != 1 or bits != 16:
+            return None
+        if framerate != sample_rate_hz:
+            return None
+        available = os.fstat(fh.fileno()).st_size - fh.tell()
+        count = min(chunk_size, max(available, 0)) // 2
+        if count == 0:
+            return None
+        samples = np.empty(count, dtype=np.int16)
+        read = fh.readinto(samples)
+    if read < count * 2:
+        samples = samples[: read // 2]
+        if not len(samples):
+            return None
+    return samples
 
 
 def _split_on_silence(
@@ -223,37 +281,31 @@ def _split_on_silence(
     if audio_len == 0:
         return []
     frame_size = max(1, int(sample_rate_hz * 0.02))
-    rms = []
-    for idx in range(0, audio_len, frame_size):
-        frame = audio[idx : idx + frame_size]
-        if frame.size == 0:
-            continue
-        rms.append(float(np.sqrt(np.mean(frame * frame))))
-    if not rms:
+    full_frames = audio_len // frame_size
+    frames = audio[: full_frames * frame_size].reshape(full_frames, frame_size)
+    energy = np.einsum("ij,ij->i", frames, frames, dtype=np.int64)
+    mean_square = energy / float(frame_size)
+    tail = audio[full_frames * frame_size :]
+    if tail.size:
+        tail_energy = np.dot(tail, tail.astype(np.int64))
+        mean_square = np.append(mean_square, tail_energy / float(tail.size))
+    if mean_square.size == 0:
         return [(0, audio_len)]
-    rms_array = np.array(rms, dtype=np.float32)
     if vad_rms_threshold > 0:
         threshold = vad_rms_threshold
     else:
-        noise_floor = float(np.percentile(rms_array, 10))
+        noise_floor = float(np.percentile(np.sqrt(mean_square), 10)) / 32768.0
         threshold = max(noise_floor * 2.5, 0.003)
-    silence_frames = rms_array < threshold
+    threshold_int = threshold * 32768.0
+    silence_frames = mean_square < threshold_int * threshold_int
     min_silence_frames = max(1, int(min_silence_seconds * sample_rate_hz / frame_size))
-    silence_regions: list[tuple[int, int]] = []
-    run_start = None
-    for idx, silent in enumerate(silence_frames):
-        if silent and run_start is None:
-            run_start = idx
-        elif not silent and run_start is not None:
-            if idx - run_start >= min_silence_frames:
-                silence_regions.append((run_start, idx))
-            run_start = None
-    if run_start is not None and len(silence_frames) - run_start >= min_silence_frames:
-        silence_regions.append((run_start, len(silence_frames)))
-    silence_samples: list[tuple[int, int]] = [
-        (start * frame_size, min(end * frame_size, audio_len))
-        for start, end in silence_regions
-    ]
+    edges = np.diff(silence_frames.astype(np.int8), prepend=0, append=0)
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    keep = run_ends - run_starts >= min_silence_frames
+    silence_starts = run_starts[keep] * frame_size
+    silence_ends = np.minimum(run_ends[keep] * frame_size, audio_len)
+    midpoints: list[int] = ((silence_starts + silence_ends) // 2).tolist()
     min_seg = max(1, int(min_segment_seconds * sample_rate_hz))
     if max_segment_seconds > 0:
         max_seg = max(min_seg, int(max_segment_seconds * sample_rate_hz))
@@ -264,17 +316,9 @@ def _split_on_silence(
     start = 0
     while start < audio_len:
         target_end = min(start + max_seg, audio_len)
-        cut = None
-        for s_start, s_end in silence_samples:
-            mid = (s_start + s_end) // 2
-            if mid <= start:
-                continue
-            if mid - start < min_seg:
-                continue
-            if mid > target_end:
-                break
-            cut = mid
-        end = cut if cut is not None else target_end
+        lo = bisect_left(midpoints, start + min_seg)
+        hi = bisect_right(midpoints, target_end)
+        end = midpoints[hi - 1] if hi > lo else target_end
         if end <= start:
             end = min(start + max_seg, audio_len)
             if end <= start:
@@ -289,42 +333,36 @@ def _split_on_silence(
 def _transcribe_segments(
     module,
     audio: np.ndarray,
-    model_path: Path,
     segments: list[tuple[int, int]],
-    condition_on_previous_text: bool,
-    language_override: str | None,
-    word_timestamps: bool,
-    hallucination_silence_threshold: float,
+    transcribe_kwargs: dict,
 ) -> str:
+    transcribe = module.transcribe
+    source = np.empty(audio.shape, dtype=np.float32)
+    np.multiply(audio, np.float32(1.0 / 32768.0), out=source, casting="unsafe")
+    try:
+        import mlx.core as mx
+    except ImportError:
+        pass
+    else:
+        source = mx.array(source)
     texts: list[str] = []
     for start, end in segments:
-        chunk = audio[start:end]
-        if len(chunk) == 0:
+        if end <= start:
             continue
-        result = _transcribe_once(
-            module,
-            chunk,
-            model_path,
-            condition_on_previous_text,
-            language_override,
-            word_timestamps,
-            hallucination_silence_threshold,
-        )
+        result = transcribe(source[start:end], **transcribe_kwargs)
         text = _extract_text(result)
         if text:
             texts.append(text)
     return " ".join(texts).strip()
 
 
-def _transcribe_once(
-    module,
-    audio,
+def _transcribe_kwargs(
     model_path: Path,
     condition_on_previous_text: bool,
     language_override: str | None,
     word_timestamps: bool,
     hallucination_silence_threshold: float,
-):
+) -> dict:
     kwargs = {
         "path_or_hf_repo": str(model_path),
         "verbose": False,
@@ -335,4 +373,4 @@ def _transcribe_once(
         kwargs["word_timestamps"] = True
         if hallucination_silence_threshold > 0:
             kwargs["hallucination_silence_threshold"] = hallucination_silence_threshold
-    return module.transcribe(audio, **kwargs)
+    return kwargs